@@ -869,54 +869,101 @@ class CacheEntry(BaseModel):
         return history
 
 
-class MessageEncoder(json.JSONEncoder):
-    """Convert Message objects to serializable dictionaries."""
+def encode_message(o: Any) -> dict[str, Any]:
+    """Convert a Message or CacheEntry object into a serializable dictionary.
 
-    def default(self, o: Any) -> Union[dict, Any]:
-        """Convert a Message object into a serializable dictionary.
+    Intended as the ``default=`` hook of ``json.dumps``: it only runs for
+    objects the C encoder cannot serialize itself, so plain dicts, lists
+    and strings stay on the stdlib fast path.
 
-        This method is called when an object cannot be serialized by default
-        methods. If the object is an instance of HumanMessage or AIMessage,
-        it is converted into a dictionary. Otherwise, the default JSONEncoder
-        behavior is used.
+    Args:
+        o: The object to serialize. Expected to be a HumanMessage,
+            AIMessage or CacheEntry instance.
 
+    Returns:
+        A dictionary containing the object's attributes.
 
-        Args:
-            o: The object to serialize. Expected to be either a HumanMessage
-            or AIMessage instance.
+    Raises:
+        TypeError: When the object is of an unsupported type.
+    """
+    if isinstance(o, (HumanMessage, AIMessage)):
+        return {
+            "type": o.type,
+            "content": o.content,
+            "response_metadata": o.response_metadata,
+            "additional_kwargs": o.additional_kwargs,
+        }
+    if isinstance(o, CacheEntry):
+        return {
+            "__type__": "CacheEntry",
+            "query": encode_message(o.query),  # Handle nested Message object
+            "response": encode_message(o.response) if o.response else None,
+            "attachments": o.attachments,
+            "tool_calls": o.tool_calls,
+            "tool_results": o.tool_results,
+        }
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
-        Returns:
-            dict: A dictionary containing the message attributes if the input is
-                a Message object.
-            Any: The result of the parent class's default method for other
-                 object types.
-        """
-        if isinstance(o, (HumanMessage, AIMessage)):
-            return {
-                "type": o.type,
-                "content": o.content,
-                "response_metadata": o.response_metadata,
-                "additional_kwargs": o.additional_kwargs,
-            }
-        if isinstance(o, CacheEntry):
-            return {
-                "__type__": "CacheEntry",
-                "query": self.default(o.query),  # Handle nested Message object
-                "response": self.default(o.response) if o.response else None,
-                "attachments": o.attachments,
-                "tool_calls": o.tool_calls,
-                "tool_results": o.tool_results,
-            }
-        return super().default(o)
+
+def decode_message(
+    dct: dict[str, Any],
+) -> Union[HumanMessage, AIMessage, CacheEntry, dict[str, Any]]:
+    """Decode JSON dictionary into Message objects if applicable.
+
+    Intended as the ``object_hook=`` hook of ``json.loads``.
+
+    Args:
+        dct (dict): Dictionary to decode, potentially representing a Message.
+
+    Returns:
+        Union[HumanMessage, AIMessage, dict]: A Message object if the input
+        dictionary represents a message, otherwise returns the original dictionary.
+    """
+    if "__type__" in dct and dct["__type__"] == "CacheEntry":
+        # Handle CacheEntry reconstruction
+        return CacheEntry(
+            query=decode_message(dct["query"]),
+            response=(decode_message(dct["response"]) if dct["response"] else None),
+            attachments=dct["attachments"],
+            tool_calls=dct.get("tool_calls", []),
+            tool_results=dct.get("tool_results", []),
+        )
+    if "type" in dct:
+        message: Union[HumanMessage, AIMessage]
+        if dct["type"] == "human":
+            message = HumanMessage(content=dct["content"])
+        elif dct["type"] == "ai":
+            message = AIMessage(content=dct["content"])
+        else:
+            return dct
+        message.additional_kwargs = dct["additional_kwargs"]
+        message.response_metadata = dct["response_metadata"]
+        return message
+    return dct
+
+
+class MessageEncoder(json.JSONEncoder):
+    """Convert Message objects to serializable dictionaries.
+
+    Prefer ``json.dumps(..., default=encode_message)`` in new code: passing
+    ``cls=`` makes the stdlib instantiate a fresh encoder per call and skip
+    its C fast path. This class is kept for existing call sites.
+    """
+
+    def default(self, o: Any) -> Union[dict, Any]:
+        """Convert a Message object into a serializable dictionary."""
+        try:
+            return encode_message(o)
+        except TypeError:
+            return super().default(o)
 
 
 class MessageDecoder(json.JSONDecoder):
     """Custom JSON decoder for deserializing Message objects.
 
-    This decoder extends the default JSONDecoder to handle JSON representations of
-    HumanMessage and AIMessage objects, converting them back into their respective
-    Python objects. It processes JSON objects containing 'type', 'content',
-    'response_metadata', and 'additional_kwargs' fields.
+    Prefer ``json.loads(..., object_hook=decode_message)`` in new code for
+    the same per-call-instantiation reason as ``MessageEncoder``. This class
+    is kept for existing call sites.
 
     Example:
         >>> decoder = MessageDecoder()
@@ -926,43 +973,7 @@ class MessageDecoder(json.JSONDecoder):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the MessageDecoder with custom object hook."""
-        super().__init__(object_hook=self._decode_message, *args, **kwargs)
-
-    def _decode_message(
-        self, dct: dict[str, Any]
-    ) -> Union[HumanMessage, AIMessage, CacheEntry, dict[str, Any]]:
-        """Decode JSON dictionary into Message objects if applicable.
-
-        Args:
-            dct (dict): Dictionary to decode, potentially representing a Message.
-
-        Returns:
-            Union[HumanMessage, AIMessage, dict]: A Message object if the input
-            dictionary represents a message, otherwise returns the original dictionary.
-        """
-        if "__type__" in dct and dct["__type__"] == "CacheEntry":
-            # Handle CacheEntry reconstruction
-            return CacheEntry(
-                query=self._decode_message(dct["query"]),
-                response=(
-                    self._decode_message(dct["response"]) if dct["response"] else None
-                ),
-                attachments=dct["attachments"],
-                tool_calls=dct.get("tool_calls", []),
-                tool_results=dct.get("tool_results", []),
-            )
-        if "type" in dct:
-            message: Union[HumanMessage, AIMessage]
-            if dct["type"] == "human":
-                message = HumanMessage(content=dct["content"])
-            elif dct["type"] == "ai":
-                message = AIMessage(content=dct["content"])
-            else:
-                return dct
-            message.additional_kwargs = dct["additional_kwargs"]
-            message.response_metadata = dct["response_metadata"]
-            return message
-        return dct
+        super().__init__(object_hook=decode_message, *args, **kwargs)
 
 
 class ProcessedRequest(BaseModel):
@@ -503,6 +503,55 @@ class DocsSummarizer(QueryHelper):
             return max(explicit, mode_default)
         return mode_default
 
+    async def _create_response_async(
+        self,
+        query: str,
+        rag_retriever: Optional[BaseRetriever] = None,
+        user_id: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        skip_user_id_check: bool = False,
+    ) -> SummarizerResponse:
+        """Collect all generate_response chunks into a single response."""
+        chunks = []
+        response_end: dict[str, Any] = {}
+        tool_calls = []
+        tool_results = []
+        async for chunk in self.generate_response(
+            query, rag_retriever, user_id, conversation_id, skip_user_id_check
+        ):
+            match chunk.type:
+                case StreamChunkType.END:
+                    response_end = chunk.data
+                    break
+                case StreamChunkType.TOOL_CALL:
+                    tool_calls.append(chunk.data)
+                case StreamChunkType.TOOL_RESULT:
+                    tool_results.append(chunk.data)
+                case StreamChunkType.SKILL_SELECTED:
+                    continue
+                case StreamChunkType.REASONING:
+                    pass
+                case StreamChunkType.TEXT:
+                    chunks.append(chunk.text)
+                case (
+                    StreamChunkType.HISTORY_COMPRESSION_START
+                    | StreamChunkType.HISTORY_COMPRESSION_END
+                ):
+                    continue
+                case _:
+                    msg = f"Unknown chunk type: {chunk.type}"
+                    logger.warning(msg)
+                    raise ValueError(msg)
+
+        return SummarizerResponse(
+            response="".join(chunks),
+            rag_chunks=response_end.get("rag_chunks", []),
+            history_truncated=response_end.get("truncated", False),
+            token_counter=response_end.get("token_counter", None),
+            tool_calls=tool_calls,
+            tool_results=tool_results,
+        )
+
     def create_response(
         self,
         query: str,
@@ -526,47 +575,8 @@ class DocsSummarizer(QueryHelper):
         Returns:
             A SummarizerResponse object containing the complete response
         """
-
-        async def drain_generate_response() -> SummarizerResponse:
-            """Inner async function to collect all response chunks."""
-            chunks = []
-            response_end: dict[str, Any] = {}
-            tool_calls = []
-            tool_results = []
-            async for chunk in self.generate_response(
+        return run_async_safely(
+            self._create_response_async(
                 query, rag_retriever, user_id, conversation_id, skip_user_id_check
-            ):
-                match chunk.type:
-                    case StreamChunkType.END:
-                        response_end = chunk.data
-                        break
-                    case StreamChunkType.TOOL_CALL:
-                        tool_calls.append(chunk.data)
-                    case StreamChunkType.TOOL_RESULT:
-                        tool_results.append(chunk.data)
-                    case StreamChunkType.SKILL_SELECTED:
-                        continue
-                    case StreamChunkType.REASONING:
-                        pass
-                    case StreamChunkType.TEXT:
-                        chunks.append(chunk.text)
-                    case (
-                        StreamChunkType.HISTORY_COMPRESSION_START
-                        | StreamChunkType.HISTORY_COMPRESSION_END
-                    ):
-                        continue
-                    case _:
-                        msg = f"Unknown chunk type: {chunk.type}"
-                        logger.warning(msg)
-                        raise ValueError(msg)
-
-            return SummarizerResponse(
-                response="".join(chunks),
-                rag_chunks=response_end.get("rag_chunks", []),
-                history_truncated=response_end.get("truncated", False),
-                token_counter=response_end.get("token_counter", None),
-                tool_calls=tool_calls,
-                tool_results=tool_results,
             )
-
-        return run_async_safely(drain_generate_response())
+        )
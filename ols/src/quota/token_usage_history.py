@@ -51,6 +51,11 @@ class TokenUsageHistory(PostgresBase):
         """Return DDL statements for token usage history tables."""
         return [self.CREATE_TOKEN_USAGE_TABLE]
 
+    @property
+    def _schema_objects(self) -> list[str]:
+        """Return relations whose presence lets connect() skip the DDL."""
+        return ["token_usage"]
+
     @connection
     def consume_tokens(
         self,
@@ -71,7 +76,7 @@ class TokenUsageHistory(PostgresBase):
         )
         updated_at = datetime.now()
 
-        with self.connection.cursor() as cursor:
+        with self._conn() as conn, conn.cursor() as cursor:
             cursor.execute(
                 TokenUsageHistory.CONSUME_TOKENS_FOR_USER,
                 {
@@ -299,6 +299,24 @@ class AppConfig:
         config.validate_yaml()
         return config
 
+    def replace_config(self, new_config: config_model.Config) -> None:
+        """Replace the configuration with an already validated Config instance."""
+        self.config = new_config
+        # reset the query filters and rag index to not use cached
+        # values
+        self._query_filters = None
+        self._rag_index_loader = None
+        self._tools_approval = None
+        self._pending_approval_store = None
+        # Clear cached_property if it exists
+        for cached_attribute in (
+            "mcp_servers_dict",
+            "tools_rag",
+            "skills_rag",
+            "solr_hybrid_search",
+        ):
+            self.__dict__.pop(cached_attribute, None)
+
     def reload_from_yaml_file(
         self,
         config_file: str,
@@ -308,24 +326,11 @@ class AppConfig:
         """Reload the configuration from the YAML file."""
         try:
             with open(config_file, encoding="utf-8") as f:
-                self.config = self._load_config_from_yaml_stream(
-                    f, ignore_llm_secrets, ignore_missing_certs
+                self.replace_config(
+                    self._load_config_from_yaml_stream(
+                        f, ignore_llm_secrets, ignore_missing_certs
+                    )
                 )
-            # reset the query filters and rag index to not use cached
-            # values
-            self._query_filters = None
-            self._rag_index_loader = None
-            self._tools_approval = None
-            self._pending_approval_store = None
-            # Clear cached_property if it exists
-            if "mcp_servers_dict" in self.__dict__:
-                del self.__dict__["mcp_servers_dict"]
-            if "tools_rag" in self.__dict__:
-                del self.__dict__["tools_rag"]
-            if "skills_rag" in self.__dict__:
-                del self.__dict__["skills_rag"]
-            if "solr_hybrid_search" in self.__dict__:
-                del self.__dict__["solr_hybrid_search"]
         except Exception as e:
             print(f"Failed to load config file {config_file}: {e!s}")
             print(traceback.format_exc())
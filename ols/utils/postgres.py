@@ -1,27 +1,79 @@
 """Shared base class for all Postgres-backed components.
 
-Provides connection lifecycle (connect, reconnect, health check)
+Provides connection-pool lifecycle (connect, reconnect, health check)
 and an auto-reconnect decorator for public methods.
 """
 
 import logging
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
 from typing import Any, Callable
 
 import psycopg2
+import psycopg2.pool
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from ols.app.models.config import PostgresConfig
 from ols.utils.ssl import libpq_tls_params
 
 logger = logging.getLogger(__name__)
 
+# connections kept open even when the pool is idle
+MIN_POOL_CONNECTIONS = 2
+
+# how long a successful query keeps connected() from issuing a new probe
+CONNECTED_CHECK_INTERVAL_SECONDS = 5.0
+
+# one pool per distinct connection configuration, shared by all
+# components (cache, quota limiters, token usage history) so they do
+# not pay separate SSL/GSS handshakes for the same database
+_pools: dict[tuple, psycopg2.pool.ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(
+    connect_kwargs: dict[str, Any], maxconn: int
+) -> tuple[psycopg2.pool.ThreadedConnectionPool, bool]:
+    """Get or create the shared connection pool for given connection parameters.
+
+    Returns the pool and whether this call created it, so callers know
+    if they own the pool lifetime or share it with other components.
+    """
+    key = tuple(sorted((k, str(v)) for k, v in connect_kwargs.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                MIN_POOL_CONNECTIONS, maxconn, **connect_kwargs
+            )
+            _pools[key] = pool
+            return pool, True
+        return pool, False
+
 
 def connection(f: Callable) -> Callable:
     """Ensure the object is connected before calling the wrapped method.
 
-    If the connection is lost, reconnect transparently.
+    If the connection is lost, reconnect transparently. Transient
+    OperationalErrors are retried with exponential backoff before the
+    exception is propagated to the caller.
     """
 
+    @retry(
+        retry=retry_if_exception_type(psycopg2.OperationalError),
+        wait=wait_exponential(multiplier=0.1, max=2.0),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
     def wrapper(connectable: Any, *args: Any, **kwargs: Any) -> Callable:
         if not connectable.connected():
             connectable.connect()
@@ -34,14 +86,18 @@ class PostgresBase(ABC):
     """Base class for components that store data in PostgreSQL.
 
     Subclasses declare their DDL via the ``_ddl_statements`` property.
-    The base class handles connecting, executing DDL, committing, and
-    health-checking.
+    The base class handles pooling, executing DDL, committing, and
+    health-checking. Each operation checks a connection out of a
+    ``ThreadedConnectionPool`` via ``_conn()``, so concurrent callers
+    run on independent connections instead of serializing on one.
     """
 
     def __init__(self, config: PostgresConfig) -> None:
-        """Initialize Postgres connection and run DDL."""
+        """Initialize Postgres connection pool and run DDL."""
         self.connection_config = config
-        self.connection: Any = None
+        self.pool: Any = None
+        self._initialized_sessions: weakref.WeakSet = weakref.WeakSet()
+        self._last_ok = 0.0
         self.connect()
 
     @property
@@ -53,10 +109,35 @@ class PostgresBase(ABC):
         SELECT pg_advisory_xact_lock(hashtext('ols_schema_init'))
     """
 
+    SCHEMA_CHECK_STATEMENT = """
+        SELECT bool_and(to_regclass(t) IS NOT NULL) FROM unnest(%s::text[]) AS t
+    """
+
+    @property
+    def _schema_objects(self) -> list[str]:
+        """Return relation names whose presence means the DDL can be skipped.
+
+        An empty list (the default) makes connect() run the DDL
+        unconditionally. Subclasses that list their relations here skip
+        the catalog locks on every reconnect once the schema exists;
+        schema additions then need a one-off migration (or a restart
+        against a database where the new relation is missing).
+        """
+        return []
+
+    def _schema_ready(self, cursor: Any) -> bool:
+        """Check whether all schema objects of this component already exist."""
+        objects = self._schema_objects
+        if not objects:
+            return False
+        cursor.execute(self.SCHEMA_CHECK_STATEMENT, (objects,))
+        row = cursor.fetchone()
+        return bool(row and row[0])
+
     def connect(self) -> None:
-        """Establish connection and initialize schema."""
-        logger.info("Establishing connection to Postgres")
-        self.connection = None
+        """Create the connection pool and initialize schema."""
+        logger.info("Establishing connection pool to Postgres")
+        self.pool = None
         config = self.connection_config
         connect_kwargs: dict[str, Any] = {
             "host": config.host,
@@ -69,30 +150,62 @@ class PostgresBase(ABC):
             "gssencmode": config.gss_encmode,
             **libpq_tls_params(config.tls_security_profile),
         }
-        self.connection = psycopg2.connect(**connect_kwargs)
+        self.pool, created_pool = _get_pool(connect_kwargs, config.max_pool)
+        conn = self.pool.getconn()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SET LOCAL lock_timeout = '60s'")
-            logger.info("Acquiring advisory lock for schema initialization")
-            cursor.execute(self.INIT_ADVISORY_LOCK)
-            for statement in self._ddl_statements:
-                cursor.execute(statement)
+            cursor = conn.cursor()
+            if not self._schema_ready(cursor):
+                cursor.execute("SET LOCAL lock_timeout = '60s'")
+                logger.info("Acquiring advisory lock for schema initialization")
+                cursor.execute(self.INIT_ADVISORY_LOCK)
+                for statement in self._ddl_statements:
+                    cursor.execute(statement)
             cursor.close()
-            self.connection.commit()
+            conn.commit()
         except Exception as e:
-            self.connection.close()
+            # only tear the pool down if this call created it; other
+            # components may be using a shared pool right now
+            if created_pool:
+                self.pool.closeall()
+            else:
+                self.pool.putconn(conn, close=True)
             logger.exception("Error initializing Postgres schema:\n%s", e)
             raise
-        self.connection.autocommit = True
+        if conn not in self._initialized_sessions:
+            self._init_session(conn)
+            self._initialized_sessions.add(conn)
+        self.pool.putconn(conn)
+        self._last_ok = time.monotonic()
+
+    def _init_session(self, conn: Any) -> None:
+        """Prepare a freshly pooled connection for use; subclasses may extend."""
+        conn.autocommit = True
+
+    @contextmanager
+    def _conn(self) -> Generator[Any, None, None]:
+        """Check a connection out of the pool for the duration of a block."""
+        conn = self.pool.getconn()
+        try:
+            if conn not in self._initialized_sessions:
+                self._init_session(conn)
+                self._initialized_sessions.add(conn)
+            yield conn
+            self._last_ok = time.monotonic()
+        finally:
+            self.pool.putconn(conn)
 
     def connected(self) -> bool:
-        """Check if the connection to Postgres is alive."""
-        if self.connection is None:
+        """Check if the connection pool to Postgres is usable."""
+        if self.pool is None or self.pool.closed:
             logger.warning("Not connected, need to reconnect later")
             return False
+        # a recent successful query is proof enough - skip the SELECT 1 probe
+        if time.monotonic() - self._last_ok < CONNECTED_CHECK_INTERVAL_SECONDS:
+            return True
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
+            with self._conn() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
             logger.info("Connection to storage is ok")
             return True
         except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
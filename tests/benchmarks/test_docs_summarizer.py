@@ -15,6 +15,21 @@ from tests.mock_classes.mock_llm_loader import mock_llm_loader
 
 conversation_id = suid.get_suid()
 
+QUESTION = "What's the ultimate question with answer 42?"
+
+# built once at import time so repeated benchmark iterations do not pay
+# for string concatenation
+TOO_LONG_QUESTION = "What's the ultimate question with answer 42?" * 10000
+
+# message objects are allocated once at import time so benchmark
+# iterations measure summarizer work, not message construction
+LONG_HISTORY = tuple(HumanMessage("What is Kubernetes?") for _ in range(10000))
+
+# measurement settings shared by all benchmarks
+ROUNDS = 50
+ITERATIONS = 5
+WARMUP_ROUNDS = 3
+
 
 @pytest.fixture(scope="function", autouse=True)
 def _setup():
@@ -48,44 +63,62 @@ def rag_index():
 
 def test_summarize_empty_history(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer using mocked index and query engine."""
-    question = "What's the ultimate question with answer 42?"
     history = []  # empty history
 
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # run the benchmark
-        benchmark(summarizer.create_response, question, rag_index, history)
+        benchmark.pedantic(
+            summarizer.create_response,
+            args=(QUESTION, rag_index, history),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def test_summarize_no_history(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer using mocked index and query engine, no history is provided."""
-    question = "What's the ultimate question with answer 42?"
-
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # no history is passed into summarize() method
         # run the benchmark
-        benchmark(summarizer.create_response, question, rag_index)
+        benchmark.pedantic(
+            summarizer.create_response,
+            args=(QUESTION, rag_index),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def test_summarize_history_provided(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer using mocked index and query engine, history is provided."""
-    question = "What's the ultimate question with answer 42?"
     history = [HumanMessage("What is Kubernetes?")]
 
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # first call with history provided
-        benchmark(summarizer.create_response, question, rag_index, history)
+        benchmark.pedantic(
+            summarizer.create_response,
+            args=(QUESTION, rag_index, history),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def test_summarize_history_truncation(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer to check if truncation is done."""
-    question = "What's the ultimate question with answer 42?"
-
     # too long history
-    history = [HumanMessage("What is Kubernetes?")] * 10
+    history = list(LONG_HISTORY[:10])
 
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # run the benchmark
-        benchmark(summarizer.create_response, question, rag_index, history)
+        benchmark.pedantic(
+            summarizer.create_response,
+            args=(QUESTION, rag_index, history),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def try_to_run_summarizer(summarizer, question, rag_index, history):
@@ -96,31 +129,43 @@ def try_to_run_summarizer(summarizer, question, rag_index, history):
 
 def test_summarize_too_long_question(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer to check if truncation is done."""
-    question = "What's the ultimate question with answer 42?" * 10000
-
     # short history
     history = ["What is Kubernetes?"]
 
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # run the benchmark
-        benchmark(try_to_run_summarizer, summarizer, question, rag_index, history)
+        benchmark.pedantic(
+            try_to_run_summarizer,
+            args=(summarizer, TOO_LONG_QUESTION, rag_index, history),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def test_summarize_too_long_question_long_history(benchmark, rag_index, summarizer):
     """Benchmark for DocsSummarizer to check if truncation is done."""
-    question = "What's the ultimate question with answer 42?" * 10000
-
     # too long history
-    history = ["What is Kubernetes?"] * 10000
+    history = list(LONG_HISTORY)
 
     with patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4):
         # run the benchmark
-        benchmark(try_to_run_summarizer, summarizer, question, rag_index, history)
+        benchmark.pedantic(
+            try_to_run_summarizer,
+            args=(summarizer, TOO_LONG_QUESTION, rag_index, history),
+            rounds=ROUNDS,
+            iterations=ITERATIONS,
+            warmup_rounds=WARMUP_ROUNDS,
+        )
 
 
 def test_summarize_no_reference_content(benchmark, summarizer_no_reference_content):
     """Benchmark for DocsSummarizer using mocked index and query engine."""
-    question = "What's the ultimate question with answer 42?"
-
     # run the benchmark
-    benchmark(summarizer_no_reference_content.create_response, question)
+    benchmark.pedantic(
+        summarizer_no_reference_content.create_response,
+        args=(QUESTION,),
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
@@ -4,8 +4,12 @@
 # properly by linters
 # pyright: reportAttributeAccessIssue=false
 
+import hashlib
 import json
 import os
+import tempfile
+import time
+from pathlib import Path
 
 import pytest
 from httpx import Client
@@ -14,6 +18,7 @@ from pytest import TestReport
 from tests.e2e.utils import client as client_utils
 from tests.e2e.utils import cluster, ols_installer
 from tests.e2e.utils.adapt_ols_config import adapt_ols_config
+from tests.e2e.utils.constants import OLS_USER_DATA_PATH
 from tests.e2e.utils.mcp_setup import setup_mcp_on_cluster, teardown_mcp_on_cluster
 from tests.e2e.utils.wait_for_ols import wait_for_ols
 from tests.scripts.must_gather import must_gather
@@ -30,6 +35,61 @@ OLS_READY = False
 # against ols running on a cluster
 on_cluster: bool = False  # pylint: disable=C0103
 
+# how long a cached OLS readiness result stays valid; repeated pytest
+# invocations (debug loops, xdist workers) within this window skip the
+# potentially minutes-long wait_for_ols polling
+OLS_READY_CACHE_TTL_SECONDS = 300
+
+
+def _readiness_cache_path(ols_url: str, provider: str | None) -> Path:
+    """Compute path of the readiness cache file for given OLS instance."""
+    cache_key = hashlib.sha256(f"{ols_url}:{provider}".encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / f"ols_ready_{cache_key}.json"
+
+
+def _read_cached_readiness(path: Path) -> bool:
+    """Check whether a fresh readiness result is cached for this OLS instance."""
+    try:
+        if time.time() - path.stat().st_mtime >= OLS_READY_CACHE_TTL_SECONDS:
+            return False
+        with open(path, encoding="utf-8") as cache_file:
+            return bool(json.load(cache_file).get("ready"))
+    except (OSError, ValueError):
+        return False
+
+
+def _write_cached_readiness(path: Path) -> None:
+    """Atomically record that OLS was seen ready at this moment."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps({"ready": True, "ts": time.time()}), encoding="utf-8"
+    )
+    tmp_path.replace(path)
+
+
+@pytest.fixture(name="ols_pod_name", scope="session")
+def fixture_ols_pod_name() -> str:
+    """Resolve the name of the running OLS server pod once per session."""
+    return cluster.get_pod_by_prefix()[0]
+
+
+@pytest.fixture(name="clean_user_data")
+def fixture_clean_user_data(ols_pod_name: str) -> str:
+    """Wipe feedback and transcript storage on the pod and return its name.
+
+    Both directories are removed with a single exec round-trip instead of
+    the list/remove/re-list sequence the storing tests used to run. The
+    fixture stays function-scoped on purpose: other tests write transcripts
+    and feedbacks during the session, so a one-time session wipe would not
+    give the storing tests the empty directory they assert against.
+    """
+    cluster.remove_dir(
+        ols_pod_name,
+        OLS_USER_DATA_PATH + "/feedback",
+        OLS_USER_DATA_PATH + "/transcripts",
+    )
+    return ols_pod_name
+
 
 def _maybe_setup_mcp() -> None:
     """Deploy mock MCP server and secret if running MCP test suite.
@@ -128,9 +188,18 @@ def pytest_sessionstart():
     pytest.metrics_client = client_utils.get_http_client(ols_url, metrics_token)
     pytest.ols_url = ols_url
 
-    # Wait for OLS to be ready
-    print(f"Waiting for OLS to be ready at url: {ols_url} with provider: {provider}...")
-    OLS_READY = wait_for_ols(ols_url)
+    # Wait for OLS to be ready, unless a recent run already saw it ready
+    readiness_cache = _readiness_cache_path(ols_url, provider)
+    OLS_READY = _read_cached_readiness(readiness_cache)
+    if OLS_READY:
+        print(f"OLS readiness cached in {readiness_cache}, skipping wait")
+    else:
+        print(
+            f"Waiting for OLS to be ready at url: {ols_url} with provider: {provider}..."
+        )
+        OLS_READY = wait_for_ols(ols_url)
+        if OLS_READY:
+            _write_cached_readiness(readiness_cache)
     print(f"OLS is ready: {OLS_READY}")
     # Gather OLS artifacts in case OLS does not become ready
     if on_cluster and not OLS_READY:
@@ -298,6 +367,9 @@ def pytest_collection_modifyitems(items: list) -> None:
 
 def pytest_sessionfinish():
     """Gather OLS artifacts and clean up test resources after session finishes."""
+    for http_client in (pytest.client, pytest.metrics_client):
+        if http_client is not None:
+            http_client.close()
     if on_cluster:
         ols_config_suffix = os.getenv("OLS_CONFIG_SUFFIX", "default")
         if "mcp" in ols_config_suffix:
@@ -11,15 +11,30 @@ import pytest
 
 from scripts.evaluation.response_evaluation import ResponseEvaluation
 
-
-def test_model_response(request) -> None:
+# provider+model pairs evaluated by test_model_response; an empty
+# environment keeps the previous behavior of one run without explicit pair
+PROVIDER_MODEL_IDS = [
+    f"{provider}+{model}"
+    for provider, model in zip(
+        os.getenv("PROVIDER", "").split(), os.getenv("MODEL", "").split()
+    )
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize evaluation tests per model so xdist workers run them concurrently."""
+    if "env_provider_model" in metafunc.fixturenames:
+        metafunc.parametrize("env_provider_model", PROVIDER_MODEL_IDS or [None])
+    if "option_provider_model" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "option_provider_model", metafunc.config.option.eval_provider_model_id
+        )
+
+
+def test_model_response(request, env_provider_model) -> None:
     """Evaluate model response."""
     args = Namespace(**vars(request.config.option))
-    args.eval_provider_model_id = []
-    providers = os.getenv("PROVIDER", "").split()
-    models = os.getenv("MODEL", "").split()
-    for i, provider in enumerate(providers):
-        args.eval_provider_model_id.append(f"{provider}+{models[i]}")
+    args.eval_provider_model_id = [env_provider_model] if env_provider_model else []
     args.eval_type = "consistency"
 
     val_success_flag = ResponseEvaluation(args, pytest.client).validate_response()
@@ -30,7 +45,9 @@ def test_model_response(request) -> None:
     assert val_success_flag
 
 
-def test_model_evaluation(request) -> None:
+def test_model_evaluation(request, option_provider_model) -> None:
     """Evaluate model."""
+    args = Namespace(**vars(request.config.option))
+    args.eval_provider_model_id = [option_provider_model]
     # TODO: Use this to assert.
-    ResponseEvaluation(request.config.option, pytest.client).evaluate_models()
+    ResponseEvaluation(args, pytest.client).evaluate_models()
@@ -6,12 +6,14 @@
 
 import json
 import re
-import time
+from datetime import datetime, timezone
 
 import pytest
 import requests
 import yaml
+from pydantic import BaseModel
 
+from ols.app.models.models import Attachment
 from ols.constants import (
     DEFAULT_CONFIGURATION_FILE,
     HTTP_REQUEST_HEADERS_TO_REDACT,
@@ -40,11 +42,80 @@ from tests.e2e.utils.postgres import (
 from tests.e2e.utils.retry import retry_until_timeout_or_success
 from tests.e2e.utils.wait_for_ols import wait_for_ols
 
+# counters that are expected to be part of metrics
+EXPECTED_COUNTERS = (
+    "ols_rest_api_calls_total",
+    "ols_llm_calls_total",
+    "ols_llm_calls_failures_total",
+    "ols_llm_token_sent_total",
+    "ols_llm_token_received_total",
+    "ols_provider_model_configuration",
+)
+# a counter name followed by a space appears in its HELP/TYPE lines
+EXPECTED_COUNTERS_PATTERN = re.compile(
+    "(" + "|".join(re.escape(counter) for counter in EXPECTED_COUNTERS) + ") "
+)
+
+# metadata attributes and endpoints that must be present in the OpenAPI schema
+REQUIRED_METADATA_ATTRIBUTES = ("openapi", "info", "components", "paths")
+REQUIRED_ENDPOINTS = ("/readiness", "/liveness", "/v1/query", "/v1/feedback")
+
+# expected topics in a LLM answer about kubernetes
+TOPIC_PATTERN = re.compile(r"kubernetes|openshift", re.IGNORECASE)
+
+# one-pass scan for redacted or leaked sensitive header values in logs
+REDACTED_HEADERS_PATTERN = re.compile(
+    '"('
+    + "|".join(re.escape(header) for header in HTTP_REQUEST_HEADERS_TO_REDACT)
+    + ')":"(XXXXX|some_value)"'
+)
+
+# sentinels the exporter is expected to log when uploading collected data
+UPLOAD_SENTINELS = ("Collected 1 files", "Uploading data chunk")
+UPLOAD_SENTINELS_PATTERN = re.compile(
+    "|".join(re.escape(sentinel) for sentinel in UPLOAD_SENTINELS)
+)
+
+# expected (question, answer fragment) pairs per conversation turn
+EXPECTED_CONVERSATION_TURNS = (
+    ("what is kubernetes?", "Kubernetes"),
+    ("what is openshift virtualization?", "OpenShift"),
+)
+
+# sample attachment shared by the attachment-related tests
+KUBE_LOG_ATTACHMENT = {
+    "attachment_type": "log",
+    "content_type": "text/plain",
+    "content": "Kubernetes is a core component of OpenShift.",
+}
+
+
+class Transcript(BaseModel):
+    """Shape of a transcript document stored by the service."""
+
+    metadata: dict
+    redacted_query: str
+    llm_response: str
+    rag_chunks: list
+    truncated: bool
+    attachments: list[Attachment]
+    tool_calls: list
+
+
+@pytest.fixture(name="expected_openapi_schema", scope="session")
+def fixture_expected_openapi_schema():
+    """Load the pre-generated OpenAPI schema once per session."""
+    with open("docs/openapi.json", encoding="utf-8") as fin:
+        return json.load(fin)
+
 
-@pytest.fixture(name="postgres_connection", scope="module")
+@pytest.fixture(name="postgres_connection", scope="session")
 def fixture_postgres_connection():
-    """Fixture with Postgres connection."""
-    return retrieve_connection()
+    """Fixture with Postgres connection shared across the whole session."""
+    connection = retrieve_connection()
+    yield connection
+    if connection is not None:
+        connection.close()
 
 
 @pytest.mark.smoketest
@@ -56,7 +127,10 @@ def test_readiness():
         response = pytest.client.get(endpoint, timeout=LLM_REST_API_TIMEOUT)
         assert response.status_code == requests.codes.ok
         response_utils.check_content_type(response, "application/json")
-        assert response.json() == {"ready": True, "reason": "service is ready"}
+        assert response_utils.parsed(response) == {
+            "ready": True,
+            "reason": "service is ready",
+        }
 
 
 @pytest.mark.smoketest
@@ -68,7 +142,7 @@ def test_liveness():
         response = pytest.client.get(endpoint, timeout=BASIC_ENDPOINTS_TIMEOUT)
         assert response.status_code == requests.codes.ok
         response_utils.check_content_type(response, "application/json")
-        assert response.json() == {"alive": True}
+        assert response_utils.parsed(response) == {"alive": True}
 
 
 def test_metrics() -> None:
@@ -77,19 +151,13 @@ def test_metrics() -> None:
     assert response.status_code == requests.codes.ok
     assert response.text is not None
 
-    # counters that are expected to be part of metrics
-    expected_counters = (
-        "ols_rest_api_calls_total",
-        "ols_llm_calls_total",
-        "ols_llm_calls_failures_total",
-        "ols_llm_token_sent_total",
-        "ols_llm_token_received_total",
-        "ols_provider_model_configuration",
-    )
-
-    # check if all counters are present
-    for expected_counter in expected_counters:
-        assert f"{expected_counter} " in response.text
+    # check if all expected counters are present: one scan over the
+    # Prometheus text instead of one substring search per counter
+    found = {
+        match.group(1) for match in EXPECTED_COUNTERS_PATTERN.finditer(response.text)
+    }
+    missing = set(EXPECTED_COUNTERS) - found
+    assert not missing, f"Counters missing in metrics: {missing}"
 
     # check the duration histogram presence
     assert 'response_duration_seconds_count{path="/metrics"}' in response.text
@@ -148,76 +216,49 @@ def test_forbidden_user():
     assert response.status_code == requests.codes.forbidden
 
 
+@pytest.mark.xdist_group("pod_userdata")
 @pytest.mark.data_export
-def test_transcripts_storing_cluster():
+def test_transcripts_storing_cluster(clean_user_data):
     """Test if the transcripts are stored properly."""
     transcripts_path = OLS_USER_DATA_PATH + "/transcripts"
     cluster_utils.wait_for_running_pod()
-    pod_name = cluster_utils.get_pod_by_prefix()[0]
-
-    # there are multiple tests running agains cluster, so transcripts
-    # can be already present - we need to ensure the storage is empty
-    # for this test
-    transcripts = cluster_utils.list_path(pod_name, transcripts_path)
-    if transcripts:
-        cluster_utils.remove_dir(pod_name, transcripts_path)
-        assert cluster_utils.list_path(pod_name, transcripts_path) is None
+    pod_name = clean_user_data
 
     response = pytest.client.post(
         "/v1/query",
         json={
             "query": "what is kubernetes?",
-            "attachments": [
-                {
-                    "attachment_type": "log",
-                    "content_type": "text/plain",
-                    # Sample content
-                    "content": "Kubernetes is a core component of OpenShift.",
-                }
-            ],
+            "attachments": [KUBE_LOG_ATTACHMENT],
         },
         timeout=LLM_REST_API_TIMEOUT,
     )
     assert response.status_code == requests.codes.ok
 
-    transcript = cluster_utils.get_single_existing_transcript(
-        pod_name, transcripts_path
+    # presence and types of llm_response, rag_chunks, truncated and
+    # tool_calls are enforced by the model validation itself
+    transcript = Transcript.model_validate(
+        cluster_utils.get_single_existing_transcript(pod_name, transcripts_path)
     )
 
-    assert transcript["metadata"]  # just check if it is not empty
-    assert transcript["redacted_query"] == "what is kubernetes?"
-    # we don't want llm response influence this test
-    assert "llm_response" in transcript
-    assert "rag_chunks" in transcript
-    assert isinstance(transcript["rag_chunks"], list)
-    assert "truncated" in transcript
-
-    # check the attachment node existence and its content
-    assert "attachments" in transcript
-
-    expected_attachment_node = [
-        {
-            "attachment_type": "log",
-            "content_type": "text/plain",
-            "content": "Kubernetes is a core component of OpenShift.",
-        }
-    ]
-    assert transcript["attachments"] == expected_attachment_node
-    assert isinstance(transcript["tool_calls"], list)
+    assert transcript.metadata  # just check if it is not empty
+    assert transcript.redacted_query == "what is kubernetes?"
+
+    # check the attachment node content
+    assert transcript.attachments == [Attachment(**KUBE_LOG_ATTACHMENT)]
 
 
 @retry(max_attempts=3, wait_between_runs=10)
-def test_openapi_endpoint():
+def test_openapi_endpoint(expected_openapi_schema):
     """Test handler for /opanapi REST API endpoint."""
     response = pytest.client.get("/openapi.json", timeout=BASIC_ENDPOINTS_TIMEOUT)
     assert response.status_code == requests.codes.ok
     response_utils.check_content_type(response, "application/json")
 
-    payload = response.json()
+    payload = response_utils.parsed(response)
     assert payload is not None, "Incorrect response"
 
     # check the metadata nodes
-    for attribute in ("openapi", "info", "components", "paths"):
+    for attribute in REQUIRED_METADATA_ATTRIBUTES:
         assert (
             attribute in payload
         ), f"Required metadata attribute {attribute} not found"
@@ -229,19 +270,15 @@ def test_openapi_endpoint():
 
     # elementary check that all mandatory endpoints are covered
     paths = payload["paths"]
-    for endpoint in ("/readiness", "/liveness", "/v1/query", "/v1/feedback"):
+    for endpoint in REQUIRED_ENDPOINTS:
         assert endpoint in paths, f"Endpoint {endpoint} is not described"
 
-    # retrieve pre-generated OpenAPI schema
-    with open("docs/openapi.json", encoding="utf-8") as fin:
-        expected_schema = json.load(fin)
-
     # remove node that is not included in pre-generated OpenAPI schema
     del payload["info"]["license"]
 
     # compare schemas (as dicts)
     assert (
-        payload == expected_schema
+        payload == expected_openapi_schema
     ), "OpenAPI schema returned from service does not have expected content."
 
 
@@ -255,57 +292,31 @@ def test_cache_existence(postgres_connection):
     assert value is not None
 
 
+def check_conversation_history(entries: list[dict], turns) -> None:
+    """Check cache entries against expected (question, answer) fragments per turn."""
+    assert len(entries) == len(turns)
+    for entry, (question, answer) in zip(entries, turns):
+        assert question in entry["human_query"]["content"]
+        # trivial check for answer (exact check is done in different tests)
+        assert answer in entry["ai_response"]["content"]
+
+
 def test_conversation_in_postgres_cache(postgres_connection) -> None:
     """Check how/if the conversation is stored in cache."""
     if postgres_connection is None:
         pytest.skip("Postgres is not accessible.")
 
     cid = suid.get_suid()
-    client_utils.perform_query(pytest.client, cid, "what is kubernetes?")
-
-    conversation, updated_at = read_conversation_history(postgres_connection, cid)
-    assert conversation is not None
-    assert updated_at is not None
-
-    # deserialize conversation into list of messages
-    deserialized = json.loads(conversation)
-    assert deserialized is not None
-
-    # we expect one question + one answer
-    assert len(deserialized) == 2
-
-    # question check
-    assert "what is kubernetes?" in deserialized[0].content
-
-    # trivial check for answer (exact check is done in different tests)
-    assert "Kubernetes" in deserialized[1].content
 
-    # second question
-    client_utils.perform_query(pytest.client, cid, "what is openshift virtualization?")
-
-    conversation, updated_at = read_conversation_history(postgres_connection, cid)
-    assert conversation is not None
-
-    # unpickle conversation into list of messages
-    deserialized = json.loads(conversation, errors="strict")
-    assert deserialized is not None
-
-    # we expect one question + one answer
-    assert len(deserialized) == 4
-
-    # first question
-    assert "what is kubernetes?" in deserialized[0].content
-
-    # first answer
-    assert "Kubernetes" in deserialized[1].content
-
-    # second question
-    assert "what is openshift virtualization?" in deserialized[2].content
-
-    # second answer
-    assert "OpenShift" in deserialized[3].content
+    # one cache entry per conversation turn, psycopg2 deserializes jsonb
+    # values; after each query the history so far is verified in one loop
+    for turn, (question, _) in enumerate(EXPECTED_CONVERSATION_TURNS, start=1):
+        client_utils.perform_query(pytest.client, cid, question)
+        entries = read_conversation_history(postgres_connection, cid)
+        check_conversation_history(entries, EXPECTED_CONVERSATION_TURNS[:turn])
 
 
+@pytest.mark.xdist_group("pod_userdata")
 @pytest.mark.data_export
 def test_user_data_collection():
     """Test user data collection and upload to ingress.
@@ -313,21 +324,6 @@ def test_user_data_collection():
     This test runs in isolation with the 'data_export' marker.
     It patches the exporter to use manual mode so it uses the ConfigMap token.
     """
-
-    def filter_logs(logs: str, last_log_line: str) -> str:
-        filtered_logs = []
-        new_logs = False
-        for line in logs.split("\n"):
-            if line == last_log_line:
-                new_logs = True
-                continue
-            if new_logs:
-                filtered_logs.append(line)
-        return "\n".join(filtered_logs)
-
-    def get_last_log_line(logs: str) -> str:
-        return [line for line in logs.split("\n") if line][-1]
-
     # Prepare: patch to manual mode, set short interval, configure stage ingress
     controller = prepare_for_data_collection_test(
         short_interval_seconds=OLS_USER_DATA_COLLECTION_INTERVAL_SHORT
@@ -337,27 +333,27 @@ def test_user_data_collection():
     pod_name = controller.pod_name
 
     # Get baseline logs
-    container_log = cluster_utils.get_container_log(
+    startup_log = cluster_utils.get_container_log(
         pod_name, data_collection_container_name
     )
-    print(f"\n=== Full exporter container log (startup) ===\n{container_log}\n")
-    last_log_line = get_last_log_line(container_log)
-
-    # Wait another cycle to verify exporter ran but found no data
-    time.sleep(OLS_USER_DATA_COLLECTION_INTERVAL_SHORT + 1)
-
-    container_log = cluster_utils.get_container_log(
-        pod_name, data_collection_container_name
+    print(f"\n=== Full exporter container log (startup) ===\n{startup_log}\n")
+    # server-side --since-time filtering relies on the test runner and
+    # the cluster having reasonably synchronized clocks
+    phase_start = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    # Wait for the exporter to run a cycle and report it found no data
+    logs = cluster_utils.wait_for_log(
+        pod_name,
+        data_collection_container_name,
+        "No data marked for collection in",
+        timeout=OLS_USER_DATA_COLLECTION_INTERVAL_SHORT * 3,
+        since_time=phase_start,
     )
-    logs = filter_logs(container_log, last_log_line)
     print(f"\n=== Exporter logs after first cycle (expecting no data) ===\n{logs}\n")
-
-    # Verify exporter ran and found no data to collect
-    assert "No data marked for collection in" in logs
     assert "Uploading data chunk" not in logs
 
     # Get log point for next check
-    last_log_line = get_last_log_line(container_log)
+    phase_start = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     # Create new data via feedback endpoint
     response = pytest.client.post(
@@ -372,50 +368,62 @@ def test_user_data_collection():
     )
     assert response.status_code == requests.codes.ok
 
-    # Wait for collection to happen
-    time.sleep(OLS_USER_DATA_COLLECTION_INTERVAL_SHORT + 5)
-
-    # Check that data was collected and sent
-    container_log = cluster_utils.get_container_log(
-        pod_name, data_collection_container_name
+    # Wait for the next cycle to collect and upload the feedback
+    logs = cluster_utils.wait_for_log(
+        pod_name,
+        data_collection_container_name,
+        "Data uploaded with request_id:",
+        timeout=OLS_USER_DATA_COLLECTION_INTERVAL_SHORT * 3 + 30,
+        since_time=phase_start,
     )
-    logs = filter_logs(container_log, last_log_line)
     print(f"\n=== Exporter logs after data creation (expecting upload) ===\n{logs}\n")
 
-    # Verify data was collected and uploaded
-    assert "Collected 1 files" in logs, "Expected 'Collected 1 files' in logs"
-    assert "Uploading data chunk" in logs, "Expected 'Uploading data chunk' in logs"
-    assert (
-        "Data uploaded with request_id:" in logs
-    ), "Expected 'Data uploaded with request_id:' in logs"
+    # Verify data was collected and uploaded: all sentinels in one log scan
+    missing = set(UPLOAD_SENTINELS) - {
+        match.group(0) for match in UPLOAD_SENTINELS_PATTERN.finditer(logs)
+    }
+    assert not missing, f"Expected sentinels missing in exporter logs: {missing}"
 
-    # Verify data was cleaned up after upload
-    user_data = cluster_utils.list_path(pod_name, f"{OLS_USER_DATA_PATH}/feedback/")
-    assert user_data == []
+    # Verify data was cleaned up after upload (removal follows the upload)
+    assert retry_until_timeout_or_success(
+        10,
+        1,
+        lambda: cluster_utils.list_path(pod_name, f"{OLS_USER_DATA_PATH}/feedback/")
+        == [],
+        "Waiting for uploaded feedback to be removed",
+    ), "Expected feedback storage to be empty after upload"
 
 
+@pytest.mark.xdist_group("serial")
 @pytest.mark.cluster
-def test_http_header_redaction():
+def test_http_header_redaction(ols_pod_name):
     """Test that sensitive HTTP headers are redacted from the logs."""
-    for header in HTTP_REQUEST_HEADERS_TO_REDACT:
-        endpoint = "/liveness"
-        with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, endpoint):
-            response = pytest.client.get(
-                endpoint,
-                headers={f"{header}": "some_value"},
-                timeout=BASIC_ENDPOINTS_TIMEOUT,
-            )
-            assert response.status_code == requests.codes.ok
-            response_utils.check_content_type(response, "application/json")
-            assert response.json() == {"alive": True}
+    endpoint = "/liveness"
+    with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, endpoint):
+        # all sensitive headers are sent (and their redaction checked)
+        # in one request instead of one round-trip per header
+        response = pytest.client.get(
+            endpoint,
+            headers=dict.fromkeys(HTTP_REQUEST_HEADERS_TO_REDACT, "some_value"),
+            timeout=BASIC_ENDPOINTS_TIMEOUT,
+        )
+        assert response.status_code == requests.codes.ok
+        response_utils.check_content_type(response, "application/json")
+        assert response_utils.parsed(response) == {"alive": True}
 
     container_log = cluster_utils.get_container_log(
-        cluster_utils.get_pod_by_prefix()[0], "lightspeed-service-api"
+        ols_pod_name, "lightspeed-service-api"
     )
 
+    # collect logged values for all sensitive headers in one log scan
+    logged_values: dict[str, set[str]] = {}
+    for match in REDACTED_HEADERS_PATTERN.finditer(container_log):
+        logged_values.setdefault(match.group(1), set()).add(match.group(2))
+
     for header in HTTP_REQUEST_HEADERS_TO_REDACT:
-        assert f'"{header}":"XXXXX"' in container_log
-        assert f'"{header}":"some_value"' not in container_log
+        values = logged_values.get(header, set())
+        assert "XXXXX" in values, f"Header {header} was not redacted in logs"
+        assert "some_value" not in values, f"Header {header} value leaked into logs"
 
 
 @pytest.mark.azure_entra_id
@@ -433,17 +441,14 @@ def test_azure_entra_id():
     assert response.status_code == requests.codes.ok
 
     response_utils.check_content_type(response, "application/json")
-    print(vars(response))
-    json_response = response.json()
+    response_utils.print_response(response)
+    json_response = response_utils.parsed(response)
 
     # checking a few major information from response
-    assert re.search(
-        r"kubernetes|openshift",
-        json_response["response"],
-        re.IGNORECASE,
-    )
+    assert TOPIC_PATTERN.search(json_response["response"])
 
 
+@pytest.mark.xdist_group("serial")
 @pytest.mark.certificates
 def test_generated_service_certs_rotation():
     """Verify OLS responds after certificate rotation."""
@@ -459,6 +464,7 @@ def test_generated_service_certs_rotation():
     assert response.status_code == requests.codes.ok
 
 
+@pytest.mark.xdist_group("serial")
 @pytest.mark.certificates
 def test_ca_service_certs_rotation():
     """Verify OLS responds after ca certificate rotation."""
@@ -524,6 +530,7 @@ def update_olsconfig(limiters: list[dict]):
     cluster_utils.run_oc(["apply", "-f", "-"], command=updated_configmap)
 
 
+@pytest.mark.xdist_group("serial")
 @pytest.mark.quota_limits
 def test_quota_limits():
     """Verify OLS quota limits."""
@@ -536,9 +543,11 @@ def test_quota_limits():
     # assert that the available quota is
     # less than the initial one hardcoded in the olsconfig
     assert (
-        response.json()["available_quotas"]["UserQuotaLimiter"] < 11111
+        response_utils.parsed(response)["available_quotas"]["UserQuotaLimiter"] < 11111
     ), "available quota was not used or user limits were ignored"
-    assert response.json()["input_tokens"] > 0, "input tokens were not populated"
+    assert (
+        response_utils.parsed(response)["input_tokens"] > 0
+    ), "input tokens were not populated"
     # Assure we're removing the correct configuration. Not assume and hardcode.
     result = json.loads(cluster_utils.run_oc(["get", "olsconfig", "-o", "json"]).stdout)
     for limiter in result["items"][0]["spec"]["ols"]["quotaHandlersConfig"][
@@ -582,11 +591,15 @@ def test_quota_limits():
     )
     # assert that the available quota is less than the initial one hardcoded in the olsconfig
     # but higher than the user limit
-    available_quota = response.json()["available_quotas"]["ClusterQuotaLimiter"]
+    available_quota = response_utils.parsed(response)["available_quotas"][
+        "ClusterQuotaLimiter"
+    ]
     assert (
         11111 < available_quota < 22222
     ), "Quota still being user limited when limitation was removed"
-    assert response.json()["input_tokens"] > 0, "input tokens were not populated"
+    assert (
+        response_utils.parsed(response)["input_tokens"] > 0
+    ), "input tokens were not populated"
     cluster_utils.run_oc(
         [
             "scale",
@@ -611,11 +624,13 @@ def test_quota_limits():
         timeout=LLM_REST_API_TIMEOUT,
     )
     with pytest.raises(KeyError):
-        assert not response.json()["available_quotas"][
+        assert not response_utils.parsed(response)["available_quotas"][
             "UserQuotaLimiter"
         ], "available quota populated after being removed from config"
     with pytest.raises(KeyError):
-        assert not response.json()["available_quotas"][
+        assert not response_utils.parsed(response)["available_quotas"][
             "ClusterQuotaLimiter"
         ], "available quota populated after being removed from config"
-    assert response.json()["input_tokens"] > 0, "input tokens were not populated"
+    assert (
+        response_utils.parsed(response)["input_tokens"] > 0
+    ), "input tokens were not populated"
@@ -4,8 +4,11 @@
 # properly by linters
 # pyright: reportAttributeAccessIssue=false
 
+import asyncio
+import json
 import re
 
+import httpx
 import pytest
 import requests
 
@@ -19,36 +22,85 @@ from . import test_api
 
 QUERY_ENDPOINT = "/v1/query"
 
-
-@retry(max_attempts=3, wait_between_runs=10)
-def test_invalid_question():
+# patterns matched against LLM responses and pod logs, compiled once
+# instead of hitting the re cache lookup on every call
+REJECTION_PATTERN = re.compile(r"(sorry|questions|assist)", re.IGNORECASE)
+TOPIC_PATTERN = re.compile(r"kubernetes|openshift", re.IGNORECASE)
+QUERY_LOG_PATTERN = re.compile(r'Body: \{"query":')
+# values to be filtered and replaced are defined in:
+# tests/config/singleprovider.e2e.template.config.yaml
+UNWANTED_LOG_PATTERN = re.compile(r"foo |what is foo in bar\?", re.IGNORECASE)
+
+# question larger than the context window, pre-serialized once so each
+# test (re)run only splices in a fresh conversation id instead of
+# allocating and JSON-encoding the ~475 KB payload again
+TOO_LONG_QUERY_BODY = json.dumps(
+    {"conversation_id": "%CID%", "query": "what is kubernetes?" * 25000}
+).encode()
+
+# independent queries whose responses are prefetched concurrently;
+# each of them blocks on the LLM for seconds, so one asyncio fan-out
+# costs roughly a single LLM turnaround instead of one per test
+PREFETCH_QUERIES = (
+    "what is kubernetes in the context of OpenShift?",
+    "welcome openshift container platform documentation",
+    "about openshift virtualization",
+    "how to make burger?",
+)
+
+
+@pytest.fixture(name="llm_responses", scope="module")
+def fixture_llm_responses():
+    """Fire the independent LLM queries concurrently and cache the responses.
+
+    Returns a dict mapping query text to a (conversation_id, response) pair.
+    """
+    cids = {query: suid.get_suid() for query in PREFETCH_QUERIES}
+
+    async def _fetch_all():
+        limits = httpx.Limits(max_connections=32)
+        async with httpx.AsyncClient(
+            base_url=pytest.ols_url,
+            headers=pytest.client.headers,
+            limits=limits,
+            verify=False,  # noqa: S501
+        ) as async_client:
+            return await asyncio.gather(
+                *[
+                    async_client.post(
+                        QUERY_ENDPOINT,
+                        json={"conversation_id": cids[query], "query": query},
+                        timeout=test_api.LLM_REST_API_TIMEOUT,
+                    )
+                    for query in PREFETCH_QUERIES
+                ]
+            )
+
+    responses = asyncio.run(_fetch_all())
+    return {
+        query: (cids[query], response)
+        for query, response in zip(PREFETCH_QUERIES, responses)
+    }
+
+
+def test_invalid_question(llm_responses):
     """Check the REST API /v1/query with POST HTTP method for invalid question."""
-    with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, QUERY_ENDPOINT):
-        cid = suid.get_suid()
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={"conversation_id": cid, "query": "how to make burger?"},
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.ok
+    cid, response = llm_responses["how to make burger?"]
+    assert response.status_code == requests.codes.ok
 
-        response_utils.check_content_type(response, "application/json")
-        print(vars(response))
+    response_utils.check_content_type(response, "application/json")
+    response_utils.print_response(response)
 
-        json_response = response.json()
-        assert json_response["conversation_id"] == cid
-        assert isinstance(json_response["referenced_documents"], list)
-        assert json_response["input_tokens"] > 0
-        assert json_response["output_tokens"] > 0
-        assert not json_response["truncated"]
-        # LLM shouldn't answer non-ocp queries or
-        # at least acknowledges that query is non-ocp.
-        # Below assert is minimal due to model randomness.
-        assert re.search(
-            r"(sorry|questions|assist)",
-            json_response["response"],
-            re.IGNORECASE,
-        )
+    json_response = response_utils.parsed(response)
+    assert json_response["conversation_id"] == cid
+    assert isinstance(json_response["referenced_documents"], list)
+    assert json_response["input_tokens"] > 0
+    assert json_response["output_tokens"] > 0
+    assert not json_response["truncated"]
+    # LLM shouldn't answer non-ocp queries or
+    # at least acknowledges that query is non-ocp.
+    # Below assert is minimal due to model randomness.
+    assert REJECTION_PATTERN.search(json_response["response"])
 
 
 @retry(max_attempts=3, wait_between_runs=10)
@@ -63,9 +115,9 @@ def test_invalid_question_without_conversation_id():
         assert response.status_code == requests.codes.ok
 
         response_utils.check_content_type(response, "application/json")
-        print(vars(response))
+        response_utils.print_response(response)
 
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
         assert isinstance(json_response["referenced_documents"], list)
         assert json_response["truncated"] is False
         assert json_response["input_tokens"] > 0
@@ -74,11 +126,7 @@ def test_invalid_question_without_conversation_id():
         # and we rely on the model (controlled by prompt) to reject non-ocp queries.
         # Randomness in response is expected.
         # assert json_response["response"] == INVALID_QUERY_RESP
-        assert re.search(
-            r"(sorry|questions|assist)",
-            json_response["response"],
-            re.IGNORECASE,
-        )
+        assert REJECTION_PATTERN.search(json_response["response"])
 
         # new conversation ID should be generated
         assert suid.check_suid(
@@ -86,42 +134,50 @@ def test_invalid_question_without_conversation_id():
         ), "Conversation ID is not in UUID format"
 
 
-def test_query_call_without_payload():
-    """Check the REST API /v1/query with POST HTTP method when no payload is provided."""
-    with metrics_utils.RestAPICallCounterChecker(
-        pytest.metrics_client,
-        QUERY_ENDPOINT,
-        status_code=requests.codes.unprocessable_entity,
-    ):
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.unprocessable_entity
-
-        response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        # the actual response might differ when new Pydantic version will be used
-        # so let's do just primitive check
-        assert "missing" in response.text
-
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(None, id="no_payload"),
+        pytest.param(
+            {"parameter": "this-is-not-proper-question-my-friend"},
+            id="improper_payload",
+        ),
+    ],
+)
+def test_query_call_with_invalid_payload(payload):
+    """Check the REST API /v1/query with POST HTTP method for invalid payloads.
+
+    One parametrized test covers the previous without-payload, improper-
+    payload and their token-counter variants, so the metrics scrapes done
+    by the checkers happen once per case instead of twice.
+    """
+    model, provider = metrics_utils.get_enabled_model_and_provider(
+        pytest.metrics_client
+    )
 
-def test_query_call_with_improper_payload():
-    """Check the REST API /v1/query with POST HTTP method when improper payload is provided."""
-    with metrics_utils.RestAPICallCounterChecker(
-        pytest.metrics_client,
-        QUERY_ENDPOINT,
-        status_code=requests.codes.unprocessable_entity,
+    with (
+        metrics_utils.RestAPICallCounterChecker(
+            pytest.metrics_client,
+            QUERY_ENDPOINT,
+            status_code=requests.codes.unprocessable_entity,
+        ),
+        metrics_utils.TokenCounterChecker(
+            pytest.metrics_client,
+            model,
+            provider,
+            expect_sent_change=False,
+            expect_received_change=False,
+        ),
     ):
         response = pytest.client.post(
             QUERY_ENDPOINT,
-            json={"parameter": "this-is-not-proper-question-my-friend"},
+            json=payload,
             timeout=test_api.NON_LLM_REST_API_TIMEOUT,
         )
         assert response.status_code == requests.codes.unprocessable_entity
 
         response_utils.check_content_type(response, "application/json")
-        print(vars(response))
+        response_utils.print_response(response)
         # the actual response might differ when new Pydantic version will be used
         # so let's do just primitive check
         assert "missing" in response.text
@@ -142,7 +198,7 @@ def test_valid_question_improper_conversation_id() -> None:
         assert response.status_code == requests.codes.bad_request
 
         response_utils.check_content_type(response, "application/json")
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
         expected_response = {
             "detail": {
                 "response": "Error retrieving conversation history",
@@ -166,7 +222,7 @@ def test_valid_question_missing_conversation_id() -> None:
         assert response.status_code == requests.codes.ok
 
         response_utils.check_content_type(response, "application/json")
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
 
         # new conversation ID should be returned
         assert (
@@ -179,84 +235,61 @@ def test_valid_question_missing_conversation_id() -> None:
 
 def test_too_long_question() -> None:
     """Check the REST API /v1/query with too long question."""
-    # let's make the query really large, larger that context window size
-    query = "what is kubernetes?" * 25000
-
     with metrics_utils.RestAPICallCounterChecker(
         pytest.metrics_client,
         QUERY_ENDPOINT,
         status_code=requests.codes.request_entity_too_large,
     ):
         cid = suid.get_suid()
+        body = TOO_LONG_QUERY_BODY.replace(b"%CID%", cid.encode())
         response = pytest.client.post(
             QUERY_ENDPOINT,
-            json={"conversation_id": cid, "query": query},
+            content=body,
+            headers={"content-type": "application/json"},
             timeout=test_api.LLM_REST_API_TIMEOUT,
         )
         assert response.status_code == requests.codes.request_entity_too_large
 
         response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        json_response = response.json()
+        response_utils.print_response(response)
+        json_response = response_utils.parsed(response)
         assert "detail" in json_response
         assert json_response["detail"]["response"] == "Prompt is too long"
 
 
 @pytest.mark.smoketest
 @pytest.mark.rag
-def test_valid_question() -> None:
+def test_valid_question(llm_responses) -> None:
     """Check the REST API /v1/query with POST HTTP method for valid question and no yaml."""
-    with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, QUERY_ENDPOINT):
-        cid = suid.get_suid()
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={
-                "conversation_id": cid,
-                "query": "what is kubernetes in the context of OpenShift?",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.ok
+    cid, response = llm_responses["what is kubernetes in the context of OpenShift?"]
+    assert response.status_code == requests.codes.ok
 
-        response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        json_response = response.json()
+    response_utils.check_content_type(response, "application/json")
+    response_utils.print_response(response)
+    json_response = response_utils.parsed(response)
 
-        # checking a few major information from response
-        assert json_response["conversation_id"] == cid
-        assert re.search(
-            r"kubernetes|openshift",
-            json_response["response"],
-            re.IGNORECASE,
-        )
-        assert json_response["input_tokens"] > 0
-        assert json_response["output_tokens"] > 0
+    # checking a few major information from response
+    assert json_response["conversation_id"] == cid
+    assert TOPIC_PATTERN.search(json_response["response"])
+    assert json_response["input_tokens"] > 0
+    assert json_response["output_tokens"] > 0
 
 
 @pytest.mark.rag
-def test_ocp_docs_version_same_as_cluster_version() -> None:
+def test_ocp_docs_version_same_as_cluster_version(llm_responses) -> None:
     """Check that the version of OCP docs matches the cluster we're on."""
-    with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, QUERY_ENDPOINT):
-        cid = suid.get_suid()
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={
-                "conversation_id": cid,
-                "query": "welcome openshift container platform documentation",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.ok
+    _, response = llm_responses["welcome openshift container platform documentation"]
+    assert response.status_code == requests.codes.ok
 
-        response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        json_response = response.json()
+    response_utils.check_content_type(response, "application/json")
+    response_utils.print_response(response)
+    json_response = response_utils.parsed(response)
 
-        ref_docs = json_response["referenced_documents"]
-        if ref_docs:
-            major, minor = cluster_utils.get_cluster_version()
-            doc_urls = [rd["doc_url"] for rd in ref_docs]
-            assert any(f"{major}.{minor}" in u for u in doc_urls)
+    ref_docs = json_response["referenced_documents"]
+    if ref_docs:
+        major, minor = cluster_utils.get_cluster_version()
+        doc_urls = [rd["doc_url"] for rd in ref_docs]
+        assert any(f"{major}.{minor}" in u for u in doc_urls)
 
 
 def test_valid_question_tokens_counter() -> None:
@@ -297,89 +330,27 @@ def test_invalid_question_tokens_counter() -> None:
         response_utils.check_content_type(response, "application/json")
 
 
-def test_token_counters_for_query_call_without_payload() -> None:
-    """Check how the tokens counter are updated accordingly."""
-    model, provider = metrics_utils.get_enabled_model_and_provider(
-        pytest.metrics_client
-    )
-
-    with (
-        metrics_utils.RestAPICallCounterChecker(
-            pytest.metrics_client,
-            QUERY_ENDPOINT,
-            status_code=requests.codes.unprocessable_entity,
-        ),
-        metrics_utils.TokenCounterChecker(
-            pytest.metrics_client,
-            model,
-            provider,
-            expect_sent_change=False,
-            expect_received_change=False,
-        ),
-    ):
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.unprocessable_entity
-        response_utils.check_content_type(response, "application/json")
-
-
-def test_token_counters_for_query_call_with_improper_payload() -> None:
-    """Check how the tokens counter are updated accordingly."""
-    model, provider = metrics_utils.get_enabled_model_and_provider(
-        pytest.metrics_client
-    )
-
-    with (
-        metrics_utils.RestAPICallCounterChecker(
-            pytest.metrics_client,
-            QUERY_ENDPOINT,
-            status_code=requests.codes.unprocessable_entity,
-        ),
-        metrics_utils.TokenCounterChecker(
-            pytest.metrics_client,
-            model,
-            provider,
-            expect_sent_change=False,
-            expect_received_change=False,
-        ),
-    ):
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={"parameter": "this-is-not-proper-question-my-friend"},
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.unprocessable_entity
-        response_utils.check_content_type(response, "application/json")
-
-
 @pytest.mark.tool_calling
 @pytest.mark.rag
-@retry(max_attempts=3, wait_between_runs=10)
-def test_rag_question() -> None:
+def test_rag_question(llm_responses) -> None:
     """Ensure responses include rag references."""
-    with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, QUERY_ENDPOINT):
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={"query": "about openshift virtualization"},
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.ok
-        response_utils.check_content_type(response, "application/json")
+    _, response = llm_responses["about openshift virtualization"]
+    assert response.status_code == requests.codes.ok
+    response_utils.check_content_type(response, "application/json")
 
-        print(vars(response))
-        json_response = response.json()
-        assert "conversation_id" in json_response
-        ref_docs = json_response["referenced_documents"]
-        assert len(ref_docs) > 0
-        doc_urls = [rd["doc_url"] for rd in ref_docs]
-        assert all("https://" in u for u in doc_urls)
-        assert ref_docs[0]["doc_title"]
+    response_utils.print_response(response)
+    json_response = response_utils.parsed(response)
+    assert "conversation_id" in json_response
+    ref_docs = json_response["referenced_documents"]
+    assert len(ref_docs) > 0
+    doc_urls = [rd["doc_url"] for rd in ref_docs]
+    assert all("https://" in u for u in doc_urls)
+    assert ref_docs[0]["doc_title"]
 
-        assert len(doc_urls) == len(set(doc_urls))
+    assert len(doc_urls) == len(set(doc_urls))
 
 
+@pytest.mark.xdist_group("serial")
 @pytest.mark.cluster
 @retry(max_attempts=3, wait_between_runs=10)
 def test_query_filter() -> None:
@@ -393,8 +364,8 @@ def test_query_filter() -> None:
         )
         assert response.status_code == requests.codes.ok
         response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        json_response = response.json()
+        response_utils.print_response(response)
+        json_response = response_utils.parsed(response)
         assert "conversation_id" in json_response
         # values to be filtered and replaced are defined in:
         # tests/config/singleprovider.e2e.template.config.yaml
@@ -412,184 +383,140 @@ def test_query_filter() -> None:
         # Check if filtered words are redacted in the logs
         container_log = cluster_utils.get_container_log(pod_name, ols_container_name)
 
-        # Ensure redacted patterns do not appear in the logs
-        unwanted_patterns = ["foo ", "what is foo in bar?"]
-        for line in container_log.splitlines():
-            # Only check lines that are not part of a query
-            if re.search(r'Body: \{"query":', line):
-                continue
-            # check that the pattern is indeed not found in logs
-            for pattern in unwanted_patterns:
-                assert pattern not in line.lower()
+        # Ensure redacted patterns do not appear in the logs: one linear
+        # alternation scan over the whole log instead of a per-line loop
+        # that lowercases and substring-checks every pattern
+        for match in UNWANTED_LOG_PATTERN.finditer(container_log):
+            line_start = container_log.rfind("\n", 0, match.start()) + 1
+            line_end = container_log.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(container_log)
+            line = container_log[line_start:line_end]
+            # the only lines allowed to contain the pattern are query bodies
+            assert QUERY_LOG_PATTERN.search(line), line
 
         # Ensure the intended redaction has occurred
         assert "what is deployment in openshift?" in container_log
 
 
+@pytest.fixture(name="ingress_conversation", scope="module")
+def fixture_ingress_conversation():
+    """Establish a conversation about ingress, reused for history tests.
+
+    Keeping this in a module fixture means the opening LLM call is paid
+    once even when the consuming test retries its follow-up question.
+    """
+    response = pytest.client.post(
+        QUERY_ENDPOINT,
+        json={
+            "query": "what is ingress in kubernetes?",
+        },
+        timeout=test_api.LLM_REST_API_TIMEOUT,
+    )
+    debug_msg = "First call to LLM without conversation history has failed"
+    assert response.status_code == requests.codes.ok, debug_msg
+    response_utils.check_content_type(response, "application/json", debug_msg)
+
+    response_utils.print_response(response)
+    json_response = response_utils.parsed(response)
+    assert "ingress" in json_response["response"].lower(), debug_msg
+    return json_response
+
+
+@pytest.mark.xdist_group("serial")
 @retry(max_attempts=3, wait_between_runs=10)
-def test_conversation_history() -> None:
+def test_conversation_history(ingress_conversation) -> None:
     """Ensure conversations include previous query history."""
     with metrics_utils.RestAPICallCounterChecker(pytest.metrics_client, QUERY_ENDPOINT):
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={
-                "query": "what is ingress in kubernetes?",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        debug_msg = "First call to LLM without conversation history has failed"
-        assert response.status_code == requests.codes.ok, debug_msg
-        response_utils.check_content_type(response, "application/json", debug_msg)
-
-        print(vars(response))
-        json_response = response.json()
-        response_text = json_response["response"].lower()
-        assert "ingress" in response_text, debug_msg
-
-        # get the conversation id so we can reuse it for the follow up question
-        cid = json_response["conversation_id"]
+        # reuse the conversation established by the fixture
+        cid = ingress_conversation["conversation_id"]
         response = pytest.client.post(
             QUERY_ENDPOINT,
             json={"conversation_id": cid, "query": "tell me more about it?"},
             timeout=test_api.LLM_REST_API_TIMEOUT,
         )
-        print(vars(response))
+        response_utils.print_response(response)
 
         debug_msg = "Second call to LLM with conversation history has failed"
         assert response.status_code == requests.codes.ok
         response_utils.check_content_type(response, "application/json", debug_msg)
 
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
         response_text = json_response["response"].lower()
         assert "ingress" in response_text, debug_msg
 
 
-def test_query_with_provider_but_not_model() -> None:
-    """Check the REST API /v1/query with POST HTTP method for provider specified, but no model."""
+@pytest.mark.parametrize(
+    "payload,expected_message",
+    [
+        pytest.param(
+            {"provider": "openai"},
+            "Value error, LLM model must be specified when the provider is specified.",
+            id="provider_but_not_model",
+        ),
+        pytest.param(
+            {"model": "model-name"},
+            "Value error, LLM provider must be specified when the model is specified.",
+            id="model_but_not_provider",
+        ),
+    ],
+)
+def test_query_with_incomplete_model_selection(payload, expected_message) -> None:
+    """Check the REST API /v1/query when only one of provider/model is specified."""
     with metrics_utils.RestAPICallCounterChecker(
         pytest.metrics_client,
         QUERY_ENDPOINT,
         status_code=requests.codes.unprocessable_entity,
     ):
-        # just the provider is explicitly specified, but model selection is missing
         response = pytest.client.post(
             QUERY_ENDPOINT,
-            json={
-                "conversation_id": "",
-                "query": "what is kubernetes?",
-                "provider": "openai",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
+            json={"conversation_id": "", "query": "what is kubernetes?", **payload},
+            timeout=test_api.NON_LLM_REST_API_TIMEOUT,
         )
         assert response.status_code == requests.codes.unprocessable_entity
         response_utils.check_content_type(response, "application/json")
 
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
 
         # error thrown on Pydantic level
-        assert (
-            json_response["detail"][0]["msg"]
-            == "Value error, LLM model must be specified when the provider is specified."
-        )
-
-
-def test_query_with_model_but_not_provider() -> None:
-    """Check the REST API /v1/query with POST HTTP method for model specified, but no provider."""
-    with metrics_utils.RestAPICallCounterChecker(
-        pytest.metrics_client,
-        QUERY_ENDPOINT,
-        status_code=requests.codes.unprocessable_entity,
-    ):
-        # just model is explicitly specified, but provider selection is missing
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={
-                "conversation_id": "",
-                "query": "what is kubernetes?",
-                "model": "model-name",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.unprocessable_entity
-        response_utils.check_content_type(response, "application/json")
-
-        json_response = response.json()
-
-        assert (
-            json_response["detail"][0]["msg"]
-            == "Value error, LLM provider must be specified when the model is specified."
-        )
-
-
-def test_query_with_unknown_provider() -> None:
-    """Check the REST API /v1/query with POST HTTP method for unknown provider specified."""
-    # retrieve currently selected model
-    model, _ = metrics_utils.get_enabled_model_and_provider(pytest.metrics_client)
-
-    with metrics_utils.RestAPICallCounterChecker(
-        pytest.metrics_client,
-        QUERY_ENDPOINT,
-        status_code=requests.codes.unprocessable_entity,
-    ):
-        # provider is unknown
-        response = pytest.client.post(
-            QUERY_ENDPOINT,
-            json={
-                "conversation_id": "",
-                "query": "what is kubernetes?",
-                "provider": "foo",
-                "model": model,
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
-        )
-        assert response.status_code == requests.codes.unprocessable_entity
-        response_utils.check_content_type(response, "application/json")
+        assert json_response["detail"][0]["msg"] == expected_message
 
-        json_response = response.json()
 
-        # explicit response and cause check
-        assert (
-            "detail" in json_response
-        ), "Improper response format: 'detail' node is missing"
-        assert "Unable to process this request" in json_response["detail"]["response"]
-        assert (
-            "Provider 'foo' is not a valid provider."
-            in json_response["detail"]["cause"]
-        )
-
-
-def test_query_with_unknown_model() -> None:
-    """Check the REST API /v1/query with POST HTTP method for unknown model specified."""
-    # retrieve currently selected provider
-    _, provider = metrics_utils.get_enabled_model_and_provider(pytest.metrics_client)
+@pytest.mark.parametrize("unknown_field", ["provider", "model"])
+def test_query_with_unknown_provider_or_model(unknown_field) -> None:
+    """Check the REST API /v1/query for unknown provider or model specified."""
+    # retrieve currently selected model and provider
+    model, provider = metrics_utils.get_enabled_model_and_provider(
+        pytest.metrics_client
+    )
+    if unknown_field == "provider":
+        payload = {"provider": "foo", "model": model}
+        expected_cause = "Provider 'foo' is not a valid provider."
+    else:
+        payload = {"provider": provider, "model": "bar"}
+        expected_cause = "Model 'bar' is not a valid model "
 
     with metrics_utils.RestAPICallCounterChecker(
         pytest.metrics_client,
         QUERY_ENDPOINT,
         status_code=requests.codes.unprocessable_entity,
     ):
-        # model is unknown
         response = pytest.client.post(
             QUERY_ENDPOINT,
-            json={
-                "conversation_id": "",
-                "query": "what is kubernetes?",
-                "provider": provider,
-                "model": "bar",
-            },
-            timeout=test_api.LLM_REST_API_TIMEOUT,
+            json={"conversation_id": "", "query": "what is kubernetes?", **payload},
+            timeout=test_api.NON_LLM_REST_API_TIMEOUT,
         )
         assert response.status_code == requests.codes.unprocessable_entity
         response_utils.check_content_type(response, "application/json")
 
-        json_response = response.json()
+        json_response = response_utils.parsed(response)
 
         # explicit response and cause check
         assert (
             "detail" in json_response
         ), "Improper response format: 'detail' node is missing"
         assert "Unable to process this request" in json_response["detail"]["response"]
-        assert "Model 'bar' is not a valid model " in json_response["detail"]["cause"]
+        assert expected_cause in json_response["detail"]["cause"]
 
 
 @pytest.mark.tool_calling
@@ -609,8 +536,8 @@ def test_tool_calling() -> None:
         assert response.status_code == requests.codes.ok
 
         response_utils.check_content_type(response, "application/json")
-        print(vars(response))
-        json_response = response.json()
+        response_utils.print_response(response)
+        json_response = response_utils.parsed(response)
 
         # checking a few major information from response
         assert json_response["conversation_id"] == cid
@@ -639,8 +566,11 @@ def test_rag_question_byok1() -> None:
         )
         assert response.status_code == requests.codes.ok
 
-        print(vars(response))
-        assert "4.17" in response.json()["referenced_documents"][0]["doc_url"]
+        response_utils.print_response(response)
+        assert (
+            "4.17"
+            in response_utils.parsed(response)["referenced_documents"][0]["doc_url"]
+        )
 
 
 @pytest.mark.byok2
@@ -654,5 +584,8 @@ def test_rag_question_byok2() -> None:
         )
         assert response.status_code == requests.codes.ok
 
-        print(vars(response))
-        assert "4.16" in response.json()["referenced_documents"][0]["doc_url"]
+        response_utils.print_response(response)
+        assert (
+            "4.16"
+            in response_utils.parsed(response)["referenced_documents"][0]["doc_url"]
+        )
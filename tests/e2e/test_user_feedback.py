@@ -30,19 +30,12 @@ def test_feedback_can_post_with_wrong_token():
     assert response.status_code == requests.codes.forbidden
 
 
+@pytest.mark.xdist_group("pod_userdata")
 @pytest.mark.data_export
-def test_feedback_storing_cluster():
+def test_feedback_storing_cluster(clean_user_data):
     """Test if the feedbacks are stored properly."""
     feedbacks_path = test_api.OLS_USER_DATA_PATH + "/feedback"
-    pod_name = cluster_utils.get_pod_by_prefix()[0]
-
-    # there are multiple tests running agains cluster, so transcripts
-    # can be already present - we need to ensure the storage is empty
-    # for this test
-    feedbacks = cluster_utils.list_path(pod_name, feedbacks_path)
-    if feedbacks:
-        cluster_utils.remove_dir(pod_name, feedbacks_path)
-        assert cluster_utils.list_path(pod_name, feedbacks_path) is None
+    pod_name = clean_user_data
 
     response = pytest.client.post(
         "/v1/feedback",
@@ -67,51 +60,31 @@ def test_feedback_storing_cluster():
 
 
 @pytest.mark.data_export
-def test_feedback_missing_conversation_id():
-    """Test posting feedback with missing conversation ID."""
-    response = pytest.client.post(
-        "/v1/feedback",
-        json={
-            "user_question": "what is OCP4?",
-            "llm_response": "Openshift 4 is ...",
-            "sentiment": 1,
-        },
-        timeout=test_api.BASIC_ENDPOINTS_TIMEOUT,
-    )
-
-    response_utils.check_missing_field_response(response, "conversation_id")
-
+@pytest.mark.parametrize(
+    "missing_field",
+    [
+        pytest.param("conversation_id", id="missing_conversation_id"),
+        pytest.param("user_question", id="missing_user_question"),
+        pytest.param("llm_response", id="missing_llm_response"),
+    ],
+)
+def test_feedback_missing_field(missing_field):
+    """Test posting feedback with one mandatory field missing."""
+    payload = {
+        "conversation_id": test_api.CONVERSATION_ID,
+        "user_question": "what is OCP4?",
+        "llm_response": "Openshift 4 is ...",
+        "sentiment": 1,
+    }
+    del payload[missing_field]
 
-@pytest.mark.data_export
-def test_feedback_missing_user_question():
-    """Test posting feedback with missing user question."""
     response = pytest.client.post(
         "/v1/feedback",
-        json={
-            "conversation_id": test_api.CONVERSATION_ID,
-            "llm_response": "Openshift 4 is ...",
-            "sentiment": 1,
-        },
-        timeout=test_api.BASIC_ENDPOINTS_TIMEOUT,
-    )
-
-    response_utils.check_missing_field_response(response, "user_question")
-
-
-@pytest.mark.data_export
-def test_feedback_missing_llm_response():
-    """Test posting feedback with missing LLM response."""
-    response = pytest.client.post(
-        "/v1/feedback",
-        json={
-            "conversation_id": test_api.CONVERSATION_ID,
-            "user_question": "what is OCP4?",
-            "sentiment": 1,
-        },
+        json=payload,
         timeout=test_api.BASIC_ENDPOINTS_TIMEOUT,
     )
 
-    response_utils.check_missing_field_response(response, "llm_response")
+    response_utils.check_missing_field_response(response, missing_field)
 
 
 @pytest.mark.data_export
@@ -2,18 +2,21 @@
 
 from typing import Optional
 
-from httpx import Client, Limits
+from httpx import Client, HTTPTransport, Limits
 
 from tests.e2e.utils.constants import LLM_REST_API_TIMEOUT
 from tests.e2e.utils.response import check_content_type
 
 
 def get_http_client(url: str, user_token: Optional[str] = None) -> Client:
-    """Get HTTP client."""
-    limits = Limits(max_keepalive_connections=0)
+    """Get HTTP client with keep-alive so all tests reuse one TCP+TLS connection."""
+    limits = Limits(
+        max_keepalive_connections=20, max_connections=20, keepalive_expiry=60.0
+    )
     client = Client(
         base_url=url,
         limits=limits,
+        transport=HTTPTransport(retries=2, verify=False),
         verify=False,  # noqa: S501
     )
     if user_token:
@@ -3,6 +3,7 @@
 import json
 import os
 import subprocess
+import time
 
 import pytest
 
@@ -289,35 +290,39 @@ def list_path(pod_name: str, path: str) -> list[str]:
         raise Exception("Error listing pod path") from e
 
 
-def remove_dir(pod_name: str, directory: str) -> None:
-    """Remove a directory in a pod."""
+def remove_dir(pod_name: str, *directories: str) -> None:
+    """Remove one or more directories in a pod using a single command."""
     try:
-        run_oc(["rsh", pod_name, "rm", "-rf", directory])
+        run_oc(["rsh", pod_name, "rm", "-rf", *directories])
     except subprocess.CalledProcessError as e:
         raise Exception("Error removing directory") from e
 
 
-def get_single_existing_transcript(pod_name: str, transcripts_path: str) -> dict:
-    """Return the content of the single transcript that is in the cluster."""
-    user_id_list = list_path(pod_name, transcripts_path)
-    assert len(user_id_list) == 1
-    user_id = user_id_list[0]
-    conv_id_list = list_path(pod_name, transcripts_path + "/" + user_id)
-    assert len(conv_id_list) == 1
-    conv_id = conv_id_list[0]
-    transcript_list = list_path(
-        pod_name, transcripts_path + "/" + user_id + "/" + conv_id
-    )
-    assert len(transcript_list) == 1
-    transcript = transcript_list[0]
-
-    full_path = f"{transcripts_path}/{user_id}/{conv_id}/{transcript}"
-
+def batch_exec(pod_name: str, script: str) -> str:
+    """Run a shell script in a pod with a single exec round-trip."""
     try:
-        transcript_content = run_oc(["exec", pod_name, "--", "cat", full_path])
-        return json.loads(transcript_content.stdout)
+        result = run_oc(["exec", pod_name, "--", "sh", "-c", script])
+        return result.stdout
     except subprocess.CalledProcessError as e:
-        raise Exception("Error reading transcript") from e
+        raise Exception("Error executing script in pod") from e
+
+
+def get_single_existing_transcript(pod_name: str, transcripts_path: str) -> dict:
+    """Return the content of the single transcript that is in the cluster.
+
+    The transcript tree is laid out as user_id/conversation_id/transcript;
+    a single batched script finds and prints the transcript instead of one
+    exec round-trip per directory level.
+    """
+    output = batch_exec(
+        pod_name,
+        f"files=$(find {transcripts_path} -mindepth 3 -maxdepth 3 -type f); "
+        'echo "$files"; echo "###CONTENT###"; cat $files',
+    )
+    file_list, _, content = output.partition("###CONTENT###")
+    transcripts = file_list.split()
+    assert len(transcripts) == 1, f"Expected exactly 1 transcript, got: {transcripts}"
+    return json.loads(content)
 
 
 def get_single_existing_feedback(
@@ -357,24 +362,70 @@ def get_single_existing_feedback(
         raise Exception("Error reading feedback") from e
 
 
-def get_container_log(pod_name: str, container_name: str) -> str:
-    """Return the logs of a container in a pod."""
+def get_container_log(
+    pod_name: str,
+    container_name: str,
+    since_time: str | None = None,
+    since_seconds: int | None = None,
+) -> str:
+    """Return the logs of a container in a pod.
+
+    With ``since_time`` (RFC3339) or ``since_seconds`` only log lines
+    newer than that point are fetched, so callers transfer O(new lines)
+    instead of the whole log of a long-running pod.
+    """
+    args = ["logs", "--follow=false", pod_name, "-c", container_name]
+    if since_time is not None:
+        args.append(f"--since-time={since_time}")
+    if since_seconds is not None:
+        args.append(f"--since={since_seconds}s")
     try:
-        result = run_oc(["logs", "--follow=false", pod_name, "-c", container_name])
+        result = run_oc(args)
         return result.stdout
     except subprocess.CalledProcessError as e:
         raise Exception("Error getting container logs") from e
 
 
+def wait_for_log(
+    pod_name: str,
+    container_name: str,
+    sentinel: str,
+    timeout: float,
+    poll: float = 0.5,
+    baseline: str = "",
+    since_time: str | None = None,
+) -> str:
+    """Poll container logs until a sentinel appears in new output.
+
+    With ``since_time`` set, each poll fetches only log lines newer than
+    that RFC3339 timestamp (filtered server-side); otherwise the full
+    log is fetched and the ``baseline`` prefix is sliced off. Returns
+    the new log portion as soon as the sentinel shows up, so callers
+    wait for the typical-case duration instead of sleeping through a
+    fixed worst-case window. Raises when the sentinel does not appear
+    within ``timeout`` seconds.
+    """
+    deadline = time.time() + timeout
+    while True:
+        if since_time is not None:
+            new_logs = get_container_log(
+                pod_name, container_name, since_time=since_time
+            )
+        else:
+            new_logs = get_container_log(pod_name, container_name)[len(baseline) :]
+        if sentinel in new_logs:
+            return new_logs
+        if time.time() >= deadline:
+            raise Exception(
+                f"Timed out waiting for '{sentinel}' in logs of container {container_name}"
+            )
+        time.sleep(poll)
+
+
 def create_file(pod_name: str, path: str, content: str) -> None:
-    """Create a file in a pod."""
-    try:
-        # ensure dir exists
-        dir_path = path.rsplit("/", 1)[0]  # without file
-        run_oc(["exec", pod_name, "--", "mkdir", "-p", dir_path])
-        run_oc(["exec", pod_name, "--", "sh", "-c", f"echo '{content}' > {path}"])
-    except subprocess.CalledProcessError as e:
-        raise Exception("Error creating file") from e
+    """Create a file in a pod, creating parent directories as needed."""
+    dir_path = path.rsplit("/", 1)[0]  # without file
+    batch_exec(pod_name, f"mkdir -p {dir_path} && echo '{content}' > {path}")
 
 
 def remove_file(pod_name: str, path: str) -> None:
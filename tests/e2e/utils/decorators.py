@@ -1,8 +1,18 @@
 """Test decorators."""
 
+import random
 import time
 from functools import wraps
 
+import httpx
+
+# errors treated as transient (network blips, timeouts) and always retried
+TRANSIENT_ERRORS = (httpx.TransportError, httpx.TimeoutException)
+
+# exponential backoff parameters: first wait, growth and random jitter
+BACKOFF_BASE = 1.0
+BACKOFF_JITTER = 0.5
+
 
 def retry(
     max_attempts=3,
@@ -12,9 +22,15 @@ def retry(
 ):
     """Construct decorator that allows to retry running selected test.
 
+    Waits between attempts grow exponentially with random jitter (so
+    concurrent workers do not stampede) and are capped by
+    ``wait_between_runs``. Transient transport errors are always
+    retried; other exceptions are retried only when they match
+    ``on_error``, everything else fails fast.
+
     Args:
         max_attempts: how many times the test will be rerun in case of failure
-        wait_between_runs: time duration between consecutive test runs
+        wait_between_runs: upper bound on the wait between consecutive test runs
         on_error: expected error type (other errors will mark test failure immediatelly)
         expected_error_message: text that must be contained in error message
                                 (if not, the test failure will be mark immediatelly)
@@ -26,31 +42,31 @@ def retry(
     def retry_test_decorator(test_function):
         @wraps(test_function)
         def wrapper(*args, **kwargs):
-            retry_count = 1
-
-            while retry_count < max_attempts:
+            for attempt in range(1, max_attempts):
                 try:
                     # try to run the test
                     return test_function(*args, **kwargs)
 
                 except Exception as e:
-                    if not isinstance(e, Exception):
+                    transient = isinstance(e, TRANSIENT_ERRORS)
+                    if not transient and not isinstance(e, on_error):
                         raise
 
                     # retrieve error message
                     error_message = str(e).strip().split("\n", maxsplit=1)[0]
 
-                    if expected_error_message not in error_message:
+                    if not transient and expected_error_message not in error_message:
                         raise
 
+                    wait = min(wait_between_runs, BACKOFF_BASE * 2 ** (attempt - 1))
+                    wait += random.uniform(0, BACKOFF_JITTER)  # noqa: S311
                     print(
                         f'Retry error: "{test_function.__name__}": {error_message}. '
-                        f"[{retry_count}/{max_attempts - 1}] "
-                        f"Retrying new execution in {wait_between_runs} second(s)"
+                        f"[{attempt}/{max_attempts - 1}] "
+                        f"Retrying new execution in {wait:.1f} second(s)"
                     )
                     # time for OLS or LLM to breath
-                    time.sleep(wait_between_runs)
-                    retry_count += 1
+                    time.sleep(wait)
 
             # preserve original traceback in case assertion Failed
             return test_function(*args, **kwargs)
@@ -1,5 +1,7 @@
 """Utilities for reading and checking metrics from REST API."""
 
+from functools import lru_cache
+
 import requests
 
 from tests.e2e.utils.constants import BASIC_ENDPOINTS_TIMEOUT
@@ -18,43 +20,46 @@ def read_metrics(client):
 
 
 def get_rest_api_counter_value(
-    client, path, status_code=requests.codes.ok, default=None
+    client, path, status_code=requests.codes.ok, default=None, metrics=None
 ):
-    """Retrieve counter value from metrics."""
-    response = read_metrics(client)
+    """Retrieve counter value from metrics, scraping them unless already provided."""
+    if metrics is None:
+        metrics = read_metrics(client)
     counter_name = "ols_rest_api_calls_total"
 
     # counters with labels have the following format:
     # rest_api_calls_total{path="/openapi.json",status_code="200"} 1.0
     prefix = f'{counter_name}{{path="{path}",status_code="{status_code}"}} '
 
-    return get_counter_value(prefix, response, default)
+    return get_counter_value(prefix, metrics, default)
 
 
-def get_response_duration_seconds_value(client, path, default=None):
-    """Retrieve counter value from metrics."""
-    response = read_metrics(client)
+def get_response_duration_seconds_value(client, path, default=None, metrics=None):
+    """Retrieve counter value from metrics, scraping them unless already provided."""
+    if metrics is None:
+        metrics = read_metrics(client)
     counter_name = "ols_response_duration_seconds_sum"
 
     # counters with response durations have the following format:
     # response_duration_seconds_sum{path="/v1/query"} 0.123
     prefix = f'{counter_name}{{path="{path}"}} '
 
-    return get_counter_value(prefix, response, default, to_int=False)
+    return get_counter_value(prefix, metrics, default, to_int=False)
 
 
 def get_model_provider_counter_value(
-    client, counter_name, model, provider, default=None
+    client, counter_name, model, provider, default=None, metrics=None
 ):
-    """Retrieve counter value from metrics."""
-    response = read_metrics(client)
+    """Retrieve counter value from metrics, scraping them unless already provided."""
+    if metrics is None:
+        metrics = read_metrics(client)
 
     # counters with model and provider have the following format:
     # llm_token_sent_total{model="model-name",provider="provider-name"} 8.0
     # llm_token_received_total{model="model-name",provider="provider-name"} 2465.0
     prefix = f'{counter_name}{{model="{model}",provider="{provider}"}} '
 
-    return get_counter_value(prefix, response, default)
+    return get_counter_value(prefix, metrics, default)
 
 
 def get_all_metric_counters(response, metric_name) -> list[float]:
@@ -92,8 +97,14 @@ def get_metric_labels(lines, info_node_name, value=None) -> dict:
     return {}
 
 
+@lru_cache(maxsize=2)
 def get_enabled_model_and_provider(client):
-    """Read configured model and provider from metrics."""
+    """Read configured model and provider from metrics.
+
+    The enabled model/provider pair does not change during a test
+    session, so the result is memoized per client to avoid repeating
+    the /metrics fetch and parse in every test that needs it.
+    """
     response = read_metrics(client)
     lines = [line.strip() for line in response.split("\n")]
 
@@ -172,11 +183,17 @@ class RestAPICallCounterChecker:
 
     def __enter__(self):
         """Retrieve old counter value before calling REST API."""
+        # both counters are parsed from a single metrics scrape
+        metrics = read_metrics(self.client)
         self.old_counter = get_rest_api_counter_value(
-            self.client, self.endpoint, status_code=self.status_code, default=0
+            self.client,
+            self.endpoint,
+            status_code=self.status_code,
+            default=0,
+            metrics=metrics,
         )
         self.old_duration = get_response_duration_seconds_value(
-            self.client, self.endpoint, default=0
+            self.client, self.endpoint, default=0, metrics=metrics
         )
 
     def __exit__(self, exc_type, exc_value, exc_tb):
@@ -184,16 +201,17 @@ class RestAPICallCounterChecker:
         if exc_type is not None:
             return
 
+        metrics = read_metrics(self.client)
+
         # test if REST API endpoint counter has been updated
         new_counter = get_rest_api_counter_value(
-            self.client, self.endpoint, status_code=self.status_code
+            self.client, self.endpoint, status_code=self.status_code, metrics=metrics
         )
         check_counter_increases(self.endpoint, self.old_counter, new_counter)
 
         # test if duration counter has been updated
         new_duration = get_response_duration_seconds_value(
-            self.client,
-            self.endpoint,
+            self.client, self.endpoint, metrics=metrics
         )
         check_duration_sum_increases(self.endpoint, self.old_duration, new_duration)
 
@@ -238,12 +256,15 @@ class TokenCounterChecker:
         """Retrieve old counter values before calling LLM."""
         if self.skip_check:
             return
+        # both token counters are parsed from a single metrics scrape
+        metrics = read_metrics(self.client)
         self.old_counter_token_sent_total = get_model_provider_counter_value(
             self.client,
             "ols_llm_token_sent_total",
             self.model,
             self.provider,
             default=0,
+            metrics=metrics,
         )
         self.old_counter_token_received_total = get_model_provider_counter_value(
             self.client,
@@ -251,15 +272,22 @@ class TokenCounterChecker:
             self.model,
             self.provider,
             default=0,
+            metrics=metrics,
         )
 
     def __exit__(self, exc_type, exc_value, exc_tb):
         """Retrieve new counter value after calling REST API, and check if it increased."""
         if self.skip_check or exc_type is not None:
             return
+        metrics = read_metrics(self.client)
+
         # check if counter for sent tokens has been updated
         new_counter_token_sent_total = get_model_provider_counter_value(
-            self.client, "ols_llm_token_sent_total", self.model, self.provider
+            self.client,
+            "ols_llm_token_sent_total",
+            self.model,
+            self.provider,
+            metrics=metrics,
         )
         check_token_counter_increases(
             "sent",
@@ -275,6 +303,7 @@ class TokenCounterChecker:
             self.model,
             self.provider,
             default=0,
+            metrics=metrics,
         )
         check_token_counter_increases(
             "received",
@@ -35,15 +35,15 @@ def retrieve_connection():
 
 def read_conversation_history_count(postgres_connection):
     """Read number of items in conversation history."""
-    query = "SELECT count(*) FROM cache;"
+    query = "SELECT count(*) FROM cache_entries;"
     with postgres_connection.cursor() as cursor:
         cursor.execute(query)
         return cursor.fetchone()
 
 
 def read_conversation_history(postgres_connection, conversation_id):
-    """Read number of items in conversation history."""
-    query = "SELECT value, updated_at FROM cache WHERE conversation_id = %s"
+    """Read all entries of one conversation history, oldest first."""
+    query = "SELECT value FROM cache_entries WHERE conversation_id = %s ORDER BY seq"
     with postgres_connection.cursor() as cursor:
         cursor.execute(query, (conversation_id,))
-        return cursor.fetchone()
+        return [row[0] for row in cursor.fetchall()]
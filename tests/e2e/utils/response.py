@@ -1,8 +1,34 @@
 """Checks for responses from the service."""
 
+import os
+
+import orjson
 import requests
 
 
+def parsed(response):
+    """Return the JSON body of a response, parsing it at most once.
+
+    httpx re-parses the body on every .json() call; caching the result
+    on the response object avoids repeated parses of large payloads.
+    orjson decodes the raw bytes faster than stdlib json, which matters
+    for the OpenAPI schema and other larger bodies.
+    """
+    if not hasattr(response, "_json_cache"):
+        response._json_cache = orjson.loads(response.content)
+    return response._json_cache
+
+
+def print_response(response):
+    """Dump response internals to stdout when E2E_VERBOSE is set.
+
+    Unconditional print(vars(response)) decodes and formats the whole
+    body (hundreds of KB for some tests) even on green runs.
+    """
+    if os.getenv("E2E_VERBOSE"):
+        print(vars(response))
+
+
 def check_content_type(response, content_type, message=""):
     """Check if response content-type is set to defined value."""
     assert response.headers["content-type"].startswith(content_type), message
@@ -24,6 +24,8 @@ from ols.app.models.models import (
     SummarizerResponse,
     TokenCounter,
     ToolCall,
+    decode_message,
+    encode_message,
 )
 from ols.constants import MEDIA_TYPE_JSON, MEDIA_TYPE_TEXT, QueryMode
 from ols.utils import suid
@@ -773,6 +775,39 @@ def test_message_decoder_other_message():
     assert type(msg) is dict
 
 
+def test_encode_message_as_default_hook():
+    """Test encoding messages via the default= hook of json.dumps."""
+    msg = HumanMessage(content="Hello")
+    encoded = json.dumps(msg, default=encode_message, separators=(",", ":"))
+
+    assert (
+        encoded
+        == '{"type":"human","content":"Hello","response_metadata":{},"additional_kwargs":{}}'
+    )
+
+
+def test_encode_message_no_serializable():
+    """Test that encode_message raises TypeError for unsupported types."""
+
+    class Foo:
+        def __init__(self):
+            pass
+
+    with pytest.raises(TypeError, match="Object of type Foo is not JSON serializable"):
+        json.dumps(Foo(), default=encode_message)
+
+
+def test_decode_message_as_object_hook():
+    """Test decoding a cache entry via the object_hook= hook of json.loads."""
+    entry = CacheEntry(query=HumanMessage("Hello"))
+    encoded = json.dumps(entry, default=encode_message, separators=(",", ":"))
+
+    decoded = json.loads(encoded, object_hook=decode_message)
+    assert type(decoded) is CacheEntry
+    assert type(decoded.query) is HumanMessage
+    assert decoded.query.content == "Hello"
+
+
 class TestToolCallModel:
     """Unit tests for the ToolCall model."""
 
@@ -0,0 +1,19 @@
+"""Shared fixtures for cache unit tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mock_register_default_jsonb():
+    """Skip jsonb parser registration that requires a real connection."""
+    with patch("ols.src.cache.postgres_cache.register_default_jsonb") as mock_register:
+        yield mock_register
+
+
+@pytest.fixture(autouse=True)
+def mock_cleanup_timer():
+    """Do not start real background eviction timers in unit tests."""
+    with patch("ols.src.cache.postgres_cache.threading.Timer") as mock_timer:
+        yield mock_timer
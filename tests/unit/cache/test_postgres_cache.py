@@ -1,14 +1,15 @@
 """Unit tests for PostgresCache class."""
 
 import json
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
+import orjson
 import psycopg2
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 
 from ols.app.models.config import PostgresConfig
-from ols.app.models.models import CacheEntry, MessageDecoder, MessageEncoder
+from ols.app.models.models import CacheEntry, MessageEncoder
 from ols.src.cache.cache_error import CacheError
 from ols.src.cache.postgres_cache import PostgresCache
 from ols.utils import suid
@@ -23,11 +24,16 @@ cache_entry_2 = CacheEntry(
 )
 
 
+def stored_value(cache_entry):
+    """Represent a cache entry the way psycopg2 returns a jsonb column."""
+    return json.loads(json.dumps(cache_entry.to_dict(), cls=MessageEncoder))
+
+
 def test_get_operation_on_empty_cache():
     """Test the Cache.get operation on empty cache."""
     # mock the query result - empty cache
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
+    mock_cursor.fetchall.return_value = []
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -39,15 +45,14 @@ def test_get_operation_on_empty_cache():
         config = PostgresConfig()
         cache = PostgresCache(config)
 
-    # call the "get" operation
-    conversation = cache.get(user_id, conversation_id)
-    assert conversation == []
+        # call the "get" operation
+        conversation = cache.get(user_id, conversation_id)
+        assert conversation == []
 
     # multiple DB operations must be performed:
     # 1. check if connection to DB is alive
     # 2. select conversation from DB
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
             (user_id, conversation_id),
@@ -56,14 +61,14 @@ def test_get_operation_on_empty_cache():
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
     # Verify the query execution
-    mock_cursor.fetchone.assert_called_once()
+    mock_cursor.fetchall.assert_called_once()
 
 
 def test_get_operation_invalid_value():
     """Test the Cache.get operation when invalid value is returned from cache."""
-    # mock the query result
+    # mock the query result - a row with unexpected number of columns
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = "Invalid value"
+    mock_cursor.fetchall.return_value = [("value", "unexpected column")]
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -83,7 +88,6 @@ def test_get_operation_invalid_value():
     # 1. check if connection to DB is alive
     # 2. select conversation from DB
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
             (user_id, conversation_id),
@@ -92,7 +96,7 @@ def test_get_operation_invalid_value():
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
     # Verify the query execution
-    mock_cursor.fetchone.assert_called_once()
+    mock_cursor.fetchall.assert_called_once()
 
 
 def test_get_operation_valid_value():
@@ -101,12 +105,10 @@ def test_get_operation_valid_value():
         cache_entry_1,
         cache_entry_2,
     ]
-    conversation = json.dumps([ce.to_dict() for ce in history], cls=MessageEncoder)
-    as_memview = memoryview(bytearray(conversation, "utf-8"))
 
-    # mock the query result
+    # mock the query result - one row per cache entry
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = (as_memview,)
+    mock_cursor.fetchall.return_value = [(stored_value(ce),) for ce in history]
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -118,15 +120,14 @@ def test_get_operation_valid_value():
         config = PostgresConfig()
         cache = PostgresCache(config)
 
-    # call the "get" operation
-    # unjsond history should be returned
-    assert cache.get(user_id, conversation_id) == history
+        # call the "get" operation
+        # unjsond history should be returned
+        assert cache.get(user_id, conversation_id) == history
 
     # multiple DB operations must be performed:
     # 1. check if connection to DB is alive
     # 2. select conversation from DB
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
             (user_id, conversation_id),
@@ -135,14 +136,68 @@ def test_get_operation_valid_value():
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
     # Verify the query execution
-    mock_cursor.fetchone.assert_called_once()
+    mock_cursor.fetchall.assert_called_once()
+
+
+def test_get_operation_cached_value():
+    """Test that a repeated Cache.get is served from the in-process read cache."""
+    history = [cache_entry_1, cache_entry_2]
+
+    # mock the query result - one row per cache entry
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = [(stored_value(ce),) for ce in history]
+
+    # do not use real PostgreSQL instance
+    with patch("psycopg2.connect") as mock_connect:
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
+
+        # first read populates the read cache, second one must not hit the DB
+        assert cache.get(user_id, conversation_id) == history
+        assert cache.get(user_id, conversation_id) == history
+
+    mock_cursor.fetchall.assert_called_once()
+
+
+def test_insert_or_append_invalidates_read_cache():
+    """Test that Cache.insert_or_append drops the conversation from the read cache."""
+    history = [cache_entry_1]
+
+    # mock the query result - one row per cache entry
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = [(stored_value(ce),) for ce in history]
+    mock_cursor.fetchone.return_value = None
+
+    # do not use real PostgreSQL instance
+    with patch("psycopg2.connect") as mock_connect:
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
+
+        # populate the read cache, then write to the conversation
+        cache.get(user_id, conversation_id)
+        cache.insert_or_append(user_id, conversation_id, cache_entry_2)
+
+        # next read must go back to the DB
+        cache.get(user_id, conversation_id)
+
+    assert mock_cursor.fetchall.call_count == 2
 
 
 def test_get_operation_on_exception():
     """Test the Cache.get operation when exception is thrown."""
     # mock the query
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.side_effect = psycopg2.DatabaseError("PLSQL error")
+    mock_cursor.fetchall.side_effect = psycopg2.DatabaseError("PLSQL error")
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -154,16 +209,16 @@ def test_get_operation_on_exception():
         config = PostgresConfig()
         cache = PostgresCache(config)
 
-    # error must be raised during cache operation
-    with pytest.raises(CacheError, match="PLSQL error"):
-        cache.get(user_id, conversation_id)
+        # error must be raised during cache operation
+        with pytest.raises(CacheError, match="PLSQL error"):
+            cache.get(user_id, conversation_id)
 
 
 def test_get_operation_on_disconnected_db():
     """Test the Cache.get operation when DB is not connected."""
     # mock the query
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
+    mock_cursor.fetchall.return_value = []
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -175,7 +230,7 @@ def test_get_operation_on_disconnected_db():
         config = PostgresConfig()
         cache = PostgresCache(config)
         # simulate DB disconnection
-        cache.connection = None
+        cache.pool = None
         assert not cache.connected()
         # DB operation should connect automatically
         cache.get(user_id, conversation_id)
@@ -193,7 +248,6 @@ def test_get_operation_on_disconnected_db():
 def test_insert_or_append_operation():
     """Test the Cache.insert_or_append operation for first item to be inserted."""
     history = cache_entry_1
-    conversation = json.dumps([history.to_dict()], cls=MessageEncoder)
 
     # mock the query result
     mock_cursor = MagicMock()
@@ -213,46 +267,23 @@ def test_insert_or_append_operation():
         # to insert new conversation history
         cache.insert_or_append(user_id, conversation_id, history)
 
-    # multiple DB operations must be performed:
+    # a single atomic statement must be performed:
     calls = [
         call(
-            PostgresCache.ADVISORY_LOCK_STATEMENT,
-            (user_id, conversation_id),
+            PostgresCache.APPEND_CONVERSATION_HISTORY_STATEMENT,
+            (user_id, conversation_id, ANY),
         ),
-        call(
-            PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(
-            PostgresCache.INSERT_CONVERSATION_HISTORY_STATEMENT,
-            (user_id, conversation_id, conversation.encode("utf-8")),
-        ),
-        call(
-            PostgresCache.UPSERT_CONVERSATION_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(PostgresCache.QUERY_TOTAL_ENTRIES),
     ]
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
 
 def test_insert_or_append_operation_append_item():
     """Test the Cache.insert_or_append operation for more item to be inserted."""
-    stored_history = cache_entry_1
-
-    old_conversation = json.dumps([stored_history.to_dict()], cls=MessageEncoder)
-    as_memview = memoryview(bytearray(old_conversation, "utf-8"))
-
     appended_history = cache_entry_2
 
-    # create json object in the exactly same format
-    whole_history = json.loads(old_conversation, cls=MessageDecoder)
-    whole_history.append(appended_history.to_dict())
-    new_conversation = json.dumps(whole_history, cls=MessageEncoder)
-
     # mock the query result
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = (as_memview,)
+    mock_cursor.fetchone.return_value = None
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -268,35 +299,117 @@ def test_insert_or_append_operation_append_item():
         # to append new history to the old one
         cache.insert_or_append(user_id, conversation_id, appended_history)
 
-    # multiple DB operations must be performed:
+    # appending is a single atomic statement - the old history
+    # must not be read or rewritten
     calls = [
         call(
-            PostgresCache.ADVISORY_LOCK_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(
-            PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(
-            PostgresCache.UPDATE_CONVERSATION_HISTORY_STATEMENT,
-            (new_conversation.encode("utf-8"), user_id, conversation_id),
+            PostgresCache.APPEND_CONVERSATION_HISTORY_STATEMENT,
+            (user_id, conversation_id, ANY),
         ),
+    ]
+    mock_cursor.execute.assert_has_calls(calls, any_order=False)
+
+
+def test_insert_many_operation():
+    """Test the Cache.insert_many operation for a batch of entries."""
+    history = [cache_entry_1, cache_entry_2]
+
+    # mock the query result
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = None
+
+    # do not use real PostgreSQL instance
+    with (
+        patch("psycopg2.connect") as mock_connect,
+        patch("ols.src.cache.postgres_cache.execute_values") as mock_execute_values,
+    ):
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
+
+        # call the "insert_many" operation to store the whole batch
+        cache.insert_many(user_id, conversation_id, history)
+
+    # all rows must be sent through one execute_values pipeline
+    mock_execute_values.assert_called_once_with(
+        mock_cursor,
+        PostgresCache.INSERT_CONVERSATION_HISTORY_BATCH_STATEMENT,
+        [(user_id, conversation_id, ANY), (user_id, conversation_id, ANY)],
+        page_size=PostgresCache.BATCH_PAGE_SIZE,
+    )
+
+    # metadata upsert and cleanup follow in the same transaction
+    calls = [
         call(
-            PostgresCache.UPSERT_CONVERSATION_STATEMENT,
-            (user_id, conversation_id),
+            PostgresCache.UPSERT_CONVERSATION_BATCH_STATEMENT,
+            (user_id, conversation_id, 2),
         ),
     ]
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
 
+def test_insert_many_operation_no_entries():
+    """Test the Cache.insert_many operation for an empty batch."""
+    # do not use real PostgreSQL instance
+    with (
+        patch("psycopg2.connect"),
+        patch("ols.src.cache.postgres_cache.execute_values") as mock_execute_values,
+    ):
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
+
+        # empty batch must not touch the database
+        cache.insert_many(user_id, conversation_id, [])
+
+    mock_execute_values.assert_not_called()
+
+
+def test_insert_many_operation_on_exception():
+    """Test the Cache.insert_many operation when exception is thrown."""
+    mock_cursor = MagicMock()
+
+    # do not use real PostgreSQL instance
+    with (
+        patch("psycopg2.connect") as mock_connect,
+        patch(
+            "ols.src.cache.postgres_cache.execute_values",
+            side_effect=psycopg2.DatabaseError("PLSQL error"),
+        ),
+    ):
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
+
+        # error must be raised during cache operation
+        with pytest.raises(CacheError, match="PLSQL error"):
+            cache.insert_many(user_id, conversation_id, [cache_entry_1])
+
+
+def test_serialize_entry():
+    """Test that cache entries are serialized for the jsonb column correctly."""
+    serialized = PostgresCache._serialize_entry(cache_entry_1.to_dict())
+    deserialized = orjson.loads(serialized.dumps(serialized.adapted))
+    assert deserialized == stored_value(cache_entry_1)
+
+
 def test_insert_or_append_operation_on_exception():
     """Test the Cache.insert_or_append operation when exception is thrown."""
     history = cache_entry_1
 
     # mock the query result
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.side_effect = psycopg2.DatabaseError("PLSQL error")
+    mock_cursor.execute.side_effect = [
+        psycopg2.DatabaseError("PLSQL error"),  # INSERT fails
+    ]
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -315,9 +428,6 @@ def test_insert_or_append_operation_on_exception():
 
 def test_insert_or_append_operation_on_disconnected_db():
     """Test the Cache.insert_or_append operation when DB is not connected."""
-    history = cache_entry_1
-    conversation = json.dumps([history.to_dict()], cls=MessageEncoder)
-
     # mock the query
     mock_cursor = MagicMock()
     mock_cursor.fetchone.return_value = None
@@ -332,49 +442,30 @@ def test_insert_or_append_operation_on_disconnected_db():
         config = PostgresConfig()
         cache = PostgresCache(config)
         # simulate DB disconnection
-        cache.connection = None
+        cache.pool = None
         assert not cache.connected()
         # DB operation should connect automatically
         cache.insert_or_append(user_id, conversation_id, cache_entry_1)
         assert cache.connected()
 
-    # multiple DB operations must be performed:
+    # a single atomic statement must be performed:
     calls = [
         call(
-            PostgresCache.ADVISORY_LOCK_STATEMENT,
-            (user_id, conversation_id),
+            PostgresCache.APPEND_CONVERSATION_HISTORY_STATEMENT,
+            (user_id, conversation_id, ANY),
         ),
-        call(
-            PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(
-            PostgresCache.INSERT_CONVERSATION_HISTORY_STATEMENT,
-            (user_id, conversation_id, conversation.encode("utf-8")),
-        ),
-        call(
-            PostgresCache.UPSERT_CONVERSATION_STATEMENT,
-            (user_id, conversation_id),
-        ),
-        call(PostgresCache.QUERY_TOTAL_ENTRIES),
-        call("SELECT 1"),
     ]
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
 
-def test_insert_or_append_transaction_management():
-    """Test that insert_or_append commits on success and restores autocommit."""
+def test_insert_or_append_single_statement():
+    """Test that insert_or_append is a single statement relying on autocommit."""
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
 
     with patch("psycopg2.connect") as mock_connect:
         mock_connect.return_value.cursor.return_value.__enter__.return_value = (
             mock_cursor
         )
-        # Mock transaction status - IDLE after successful commit
-        mock_connect.return_value.get_transaction_status.return_value = (
-            psycopg2.extensions.TRANSACTION_STATUS_IDLE
-        )
 
         config = PostgresConfig()
         cache = PostgresCache(config)
@@ -382,27 +473,26 @@ def test_insert_or_append_transaction_management():
 
         cache.insert_or_append(user_id, conversation_id, cache_entry_1)
 
-    assert mock_connect.return_value.commit.call_count == commit_count_before + 1
+    # the append is one atomic CTE statement, no explicit transaction is needed
+    mock_cursor.execute.assert_called_once_with(
+        PostgresCache.APPEND_CONVERSATION_HISTORY_STATEMENT,
+        (user_id, conversation_id, ANY),
+    )
+    assert mock_connect.return_value.commit.call_count == commit_count_before
     mock_connect.return_value.rollback.assert_not_called()
-    assert mock_connect.return_value.autocommit is True
 
 
-def test_insert_or_append_rollback_on_error():
-    """Test that insert_or_append rolls back on error and restores autocommit."""
+def test_insert_or_append_no_rollback_on_error():
+    """Test that a failed append raises CacheError without manual rollback."""
     mock_cursor = MagicMock()
     mock_cursor.execute.side_effect = [
-        None,  # SELECT 1 (connection check)
-        psycopg2.DatabaseError("insert failed"),  # advisory lock
+        psycopg2.DatabaseError("insert failed"),  # append statement
     ]
 
     with patch("psycopg2.connect") as mock_connect:
         mock_connect.return_value.cursor.return_value.__enter__.return_value = (
             mock_cursor
         )
-        # Mock transaction status - INERROR after exception
-        mock_connect.return_value.get_transaction_status.return_value = (
-            psycopg2.extensions.TRANSACTION_STATUS_INERROR
-        )
 
         config = PostgresConfig()
         cache = PostgresCache(config)
@@ -410,9 +500,8 @@ def test_insert_or_append_rollback_on_error():
         with pytest.raises(CacheError, match="insert failed"):
             cache.insert_or_append(user_id, conversation_id, cache_entry_1)
 
-    # Rollback called three times: before disabling autocommit, in except block, and in finally
-    assert mock_connect.return_value.rollback.call_count == 3
-    assert mock_connect.return_value.autocommit is True
+    # autocommit means there is no open transaction to roll back
+    mock_connect.return_value.rollback.assert_not_called()
 
 
 def test_list_operation():
@@ -425,9 +514,9 @@ def test_list_operation():
         ("conversation_3", "Third topic", 1737370700.0, 3),
     ]
 
-    # Mock the database cursor behavior
+    # Mock the database cursor behavior - rows are streamed by iteration
     mock_cursor = MagicMock()
-    mock_cursor.fetchall.return_value = mock_conversations
+    mock_cursor.__iter__.return_value = iter(mock_conversations)
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -455,20 +544,16 @@ def test_list_operation():
     # 1. check if connection to DB is alive
     # 2. list conversations from DB
     calls = [
-        call("SELECT 1"),
         call(PostgresCache.LIST_CONVERSATIONS_STATEMENT, (user_id,)),
     ]
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
 
-    # Verify the query execution
-    mock_cursor.fetchall.assert_called_once()
-
 
 def test_list_operation_on_exception():
     """Test the Cache.list operation when an exception is raised."""
     # Mock the database cursor behavior to raise an exception
     mock_cursor = MagicMock()
-    mock_cursor.fetchall.side_effect = psycopg2.DatabaseError("PLSQL error")
+    mock_cursor.execute.side_effect = psycopg2.DatabaseError("PLSQL error")
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -490,7 +575,7 @@ def test_list_operation_on_disconnected_db():
     # mock the query
     mock_cursor = MagicMock()
     mock_cursor.fetchone.return_value = None
-    mock_cursor.fetchall.return_value = []
+    mock_cursor.__iter__.return_value = iter([])
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect") as mock_connect:
@@ -502,7 +587,7 @@ def test_list_operation_on_disconnected_db():
         config = PostgresConfig()
         cache = PostgresCache(config)
         # simulate DB disconnection
-        cache.connection = None
+        cache.pool = None
         assert not cache.connected()
         # DB operation should connect automatically
         cache.list(user_id)
@@ -538,7 +623,6 @@ def test_set_topic_summary_operation():
     # 1. check if connection to DB is alive
     # 2. upsert topic summary
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.INSERT_OR_UPDATE_TOPIC_SUMMARY_STATEMENT,
             (user_id, conversation_id, "Test Topic Summary"),
@@ -549,11 +633,9 @@ def test_set_topic_summary_operation():
 
 def test_set_topic_summary_operation_on_exception():
     """Test the Cache.set_topic_summary operation when an exception is raised."""
-    # Mock the database cursor behavior to raise an exception on the second execute call
-    # (first call is "SELECT 1" for connection check)
+    # Mock the database cursor behavior to raise an exception on execute
     mock_cursor = MagicMock()
     mock_cursor.execute.side_effect = [
-        None,  # SELECT 1 succeeds
         psycopg2.DatabaseError("PLSQL error"),  # actual operation fails
     ]
 
@@ -598,7 +680,6 @@ def test_delete_operation():
     # 1. check if connection to DB is alive
     # 2. delete one conversation from DB
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.DELETE_SINGLE_CONVERSATION_STATEMENT,
             (user_id, conversation_id),
@@ -633,7 +714,6 @@ def test_delete_operation_not_found():
     # 1. check if connection to DB is alive
     # 2. delete one conversation from DB
     calls = [
-        call("SELECT 1"),
         call(
             PostgresCache.DELETE_SINGLE_CONVERSATION_STATEMENT,
             (user_id, conversation_id),
@@ -659,7 +739,7 @@ def test_delete_operation_on_exception():
         cache = PostgresCache(config)
 
         # Verify that the exception is raised
-        with pytest.raises(psycopg2.DatabaseError, match="PLSQL error"):
+        with pytest.raises(CacheError, match="PLSQL error"):
             cache.delete(user_id, conversation_id)
 
 
@@ -679,7 +759,7 @@ def test_delete_operation_on_disconnected_db():
         config = PostgresConfig()
         cache = PostgresCache(config)
         # simulate DB disconnection
-        cache.connection = None
+        cache.pool = None
         assert not cache.connected()
         # DB operation should connect automatically
         cache.delete(user_id, conversation_id)
@@ -726,7 +806,6 @@ def test_delete_rollback_on_error():
     """Test that delete rolls back on error and restores autocommit."""
     mock_cursor = MagicMock()
     mock_cursor.execute.side_effect = [
-        None,  # SELECT 1 (connection check)
         psycopg2.DatabaseError("delete failed"),  # DELETE statement
     ]
 
@@ -750,79 +829,97 @@ def test_delete_rollback_on_error():
     assert mock_connect.return_value.autocommit is True
 
 
-def test_cleanup_method_when_clean_not_needed():
-    """Test the static method that cleans up PG cache."""
+def test_background_cleanup(mock_cleanup_timer):
+    """Test that eviction is scheduled at startup and runs off the write path."""
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = (200,)
-    capacity = 1000
 
     # do not use real PostgreSQL instance
-    with patch("psycopg2.connect"):
-        PostgresCache._cleanup(mock_cursor, capacity)
+    with patch("psycopg2.connect") as mock_connect:
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
 
-    # Verify the query execution
-    mock_cursor.execute.assert_called_once_with(PostgresCache.QUERY_TOTAL_ENTRIES)
+        # initialize Postgres cache
+        config = PostgresConfig()
+        cache = PostgresCache(config)
 
+        # a janitor timer is scheduled at startup
+        mock_cleanup_timer.assert_called_once_with(
+            PostgresCache.CLEANUP_INTERVAL_SECONDS, cache._run_cleanup
+        )
+
+        # the janitor evicts entries above capacity and reschedules itself
+        cache._run_cleanup()
 
-def test_cleanup_method_when_clean_performed():
-    """Test the static method that cleans up PG cache by evicting one message."""
-    # Prepare mock data for eviction: a conversation with 2 messages
-    value = [cache_entry_1.to_dict(), cache_entry_2.to_dict()]
-    conversation = json.dumps(value, cls=MessageEncoder)
-    value_bytes = conversation.encode("utf-8")
-    row = (user_id, conversation_id, value_bytes)
+    mock_cursor.execute.assert_called_with(
+        PostgresCache.DELETE_OLDEST_ENTRIES_STATEMENT, (config.max_entries,)
+    )
+    assert mock_cleanup_timer.call_count == 2
 
-    # After evicting the oldest message, the conversation has 1 message left
-    trimmed_value = [cache_entry_2.to_dict()]
-    trimmed_conversation = json.dumps(trimmed_value, cls=MessageEncoder)
-    trimmed_value_bytes = trimmed_conversation.encode("utf-8")
 
+def test_cleanup_method():
+    """Test the static method that cleans up PG cache by evicting oldest entries."""
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.side_effect = [(200,), row]
-    capacity = 199  # Total 200 > 199, so evict 1 message
+    capacity = 199
 
     # do not use real PostgreSQL instance
     with patch("psycopg2.connect"):
         PostgresCache._cleanup(mock_cursor, capacity)
 
-    # Verify the query executions: get total, get oldest row, update the trimmed conversation
-    calls = [
-        call(PostgresCache.QUERY_TOTAL_ENTRIES),
-        call(PostgresCache.SELECT_OLDEST_ROW),
-        call(
-            PostgresCache.UPDATE_CONVERSATION_HISTORY_STATEMENT,
-            (trimmed_value_bytes, user_id, conversation_id),
-        ),
-    ]
-    mock_cursor.execute.assert_has_calls(calls, any_order=False)
+    # eviction is a single DELETE keeping the newest `capacity` entries
+    mock_cursor.execute.assert_called_once_with(
+        PostgresCache.DELETE_OLDEST_ENTRIES_STATEMENT, (capacity,)
+    )
+
+
+def test_prepare_statements_on_connect():
+    """Test that hot statements are prepared when the connection is established."""
+    # do not use real PostgreSQL instance
+    with patch("psycopg2.connect") as mock_connect:
+        # initialize Postgres cache
+        config = PostgresConfig()
+        PostgresCache(config)
+
+    # DDL and PREPAREs share the plain (non context-managed) cursor
+    plain_cursor = mock_connect.return_value.cursor.return_value
+    executed = [c.args[0] for c in plain_cursor.execute.call_args_list]
+    for statement in PostgresCache.PREPARE_STATEMENTS:
+        assert statement in executed
+
+
+def test_lz4_compression_enabled_on_connect():
+    """Test that connect() tries to switch the value column to LZ4 compression."""
+    # do not use real PostgreSQL instance
+    with patch("psycopg2.connect") as mock_connect:
+        config = PostgresConfig()
+        PostgresCache(config)
+
+    plain_cursor = mock_connect.return_value.cursor.return_value
+    executed = [c.args[0] for c in plain_cursor.execute.call_args_list]
+    assert PostgresCache.SET_VALUE_COMPRESSION in executed
 
 
 def test_ready():
     """Test the Cache.ready operation."""
     # do not use real PostgreSQL instance
-    with patch("psycopg2.connect"):
+    with patch("psycopg2.connect") as mock_connect:
         # initialize Postgres cache
         config = PostgresConfig()
         cache = PostgresCache(config)
 
-        # mock the connection state 0 - open
-        cache.connection.closed = 0
+        connection = mock_connect.return_value
         # patch the poll function to return POLL_OK
-        cache.connection.poll = MagicMock(return_value=psycopg2.extensions.POLL_OK)
+        connection.poll = MagicMock(return_value=psycopg2.extensions.POLL_OK)
         # cache is ready
         assert cache.ready()
 
-        # mock the connection state 1 - closed
-        cache.connection.closed = 1
-        # cache is not ready
-        assert not cache.ready()
-
         for error_type in (psycopg2.OperationalError, psycopg2.InterfaceError):
-            # mock the connection state 0 - open
-            cache.connection.closed = 0
-            # patch the poll function to raise OperationalError
-            cache.connection.poll = MagicMock(
-                side_effect=error_type("Connection closed")
-            )
+            # patch the poll function to raise an error
+            connection.poll = MagicMock(side_effect=error_type("Connection closed"))
             # cache is not ready
             assert not cache.ready()
+
+        # simulate a closed pool
+        cache.pool = None
+        # cache is not ready
+        assert not cache.ready()
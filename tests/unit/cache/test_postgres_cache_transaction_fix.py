@@ -20,50 +20,37 @@ cache_entry = CacheEntry(
 )
 
 
-def test_insert_or_append_transaction_status_check_on_success():
-    """Test that transaction status is checked before setting autocommit on success."""
+def test_insert_or_append_needs_no_transaction_management():
+    """Test that insert_or_append leaves autocommit alone and never commits itself."""
     mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
 
     with patch("psycopg2.connect") as mock_connect:
-        # Mock connection with proper transaction status
         mock_connection = mock_connect.return_value
         mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
-        # After successful commit, transaction should be IDLE
-        mock_connection.get_transaction_status.return_value = (
-            psycopg2.extensions.TRANSACTION_STATUS_IDLE
-        )
 
         config = PostgresConfig()
         cache = PostgresCache(config)
+        commit_count_before = mock_connection.commit.call_count
 
         cache.insert_or_append(user_id, conversation_id, cache_entry)
 
-    # Verify transaction status was checked
-    mock_connection.get_transaction_status.assert_called()
-    # Commit should be called (successful operation)
-    mock_connection.commit.assert_called()
-    # Rollback should NOT be called in finally (transaction already IDLE)
-    # Note: rollback might be called in except block, but not in finally
+    # the append is one atomic statement under session autocommit
+    assert mock_connection.commit.call_count == commit_count_before
+    mock_connection.rollback.assert_not_called()
     assert mock_connection.autocommit is True
 
 
-def test_insert_or_append_transaction_status_check_on_error():
-    """Test that active transaction is rolled back before setting autocommit on error."""
+def test_insert_or_append_no_rollback_on_error():
+    """Test that a failed append propagates CacheError without manual rollback."""
     mock_cursor = MagicMock()
     # Simulate database error
     mock_cursor.execute.side_effect = [
-        None,  # SELECT 1 (connection check)
-        psycopg2.DatabaseError("test error"),  # advisory lock fails
+        psycopg2.DatabaseError("test error"),  # append fails
     ]
 
     with patch("psycopg2.connect") as mock_connect:
         mock_connection = mock_connect.return_value
         mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
-        # After error, transaction is still ACTIVE (not IDLE)
-        mock_connection.get_transaction_status.return_value = (
-            psycopg2.extensions.TRANSACTION_STATUS_INERROR
-        )
 
         config = PostgresConfig()
         cache = PostgresCache(config)
@@ -71,13 +58,8 @@ def test_insert_or_append_transaction_status_check_on_error():
         with pytest.raises(CacheError):
             cache.insert_or_append(user_id, conversation_id, cache_entry)
 
-    # Verify transaction status was checked in finally
-    mock_connection.get_transaction_status.assert_called()
-    # Rollback should be called three times:
-    # 1. Before disabling autocommit (transaction is not IDLE)
-    # 2. In the except block
-    # 3. In the finally block because transaction is not IDLE
-    assert mock_connection.rollback.call_count == 3
+    # autocommit means there is no open transaction to roll back
+    mock_connection.rollback.assert_not_called()
     assert mock_connection.autocommit is True
 
 
@@ -109,7 +91,6 @@ def test_delete_transaction_status_check_on_error():
     """Test that active transaction is rolled back before setting autocommit on delete error."""
     mock_cursor = MagicMock()
     mock_cursor.execute.side_effect = [
-        None,  # SELECT 1 (connection check)
         psycopg2.DatabaseError("delete failed"),  # delete fails
     ]
 
@@ -3,9 +3,16 @@
 import pytest
 
 from ols import config
+from ols.utils import postgres
 
 
 @pytest.fixture(scope="function", autouse=True)
 def ensure_empty_config_for_each_unit_test_by_default():
     """Set up fixture for all unit tests."""
     config.reload_empty()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def ensure_empty_postgres_pool_registry():
+    """Do not share Postgres connection pools between unit tests."""
+    postgres._pools.clear()
@@ -0,0 +1,21 @@
+"""Shared fixtures for query helper unit tests."""
+
+import copy
+
+import pytest
+
+from ols import config
+
+
+@pytest.fixture(scope="package", name="base_config")
+def fixture_base_config():
+    """Parse and validate valid_config_without_mcp.yaml only once per package."""
+    config.reload_from_yaml_file("tests/config/valid_config_without_mcp.yaml")
+    return copy.deepcopy(config.config)
+
+
+@pytest.fixture(scope="package", name="base_config_full")
+def fixture_base_config_full():
+    """Parse and validate valid_config.yaml only once per package."""
+    config.reload_from_yaml_file("tests/config/valid_config.yaml")
+    return copy.deepcopy(config.config)
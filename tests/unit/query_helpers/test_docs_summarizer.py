@@ -1,5 +1,8 @@
 """Unit tests for DocsSummarizer PR2 class."""
 
+import asyncio
+import contextlib
+import copy
 import logging
 from typing import ClassVar
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
@@ -26,6 +29,10 @@ from ols.src.query_helpers.docs_summarizer import (  # noqa: E402
     DocsSummarizer,
     QueryHelper,
 )
+from ols.src.query_helpers.llm_execution_agent import (  # noqa: E402
+    LLMExecutionAgent,
+)
+from ols.utils import token_handler  # noqa: E402
 from ols.utils.logging_configurator import configure_logging  # noqa: E402
 from ols.utils.mcp_utils import build_mcp_config, gather_mcp_tools  # noqa: E402
 from ols.utils.token_handler import (  # noqa: E402
@@ -42,6 +49,10 @@ from tests.mock_classes.mock_llm_loader import mock_llm_loader  # noqa: E402
 from tests.mock_classes.mock_retrievers import MockRetriever  # noqa: E402
 from tests.mock_classes.mock_tools import mock_tools_map  # noqa: E402
 
+# stateless mocks shared across tests to avoid per-test reconstruction
+_MOCK_RETRIEVER = MockRetriever()
+_MOCK_LOADER_NONE = mock_llm_loader(None)
+
 
 def check_summary_result(summary, question: str) -> None:
     """Check result produced by DocsSummarizer.create_response method."""
@@ -58,9 +69,37 @@ def check_summary_result(summary, question: str) -> None:
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
-    """Set up config for tests."""
-    config.reload_from_yaml_file("tests/config/valid_config_without_mcp.yaml")
+def _setup(base_config):
+    """Set up config for tests.
+
+    Each test gets a pristine deep copy of the parsed configuration,
+    skipping the YAML parse and pydantic validation a full reload pays.
+    """
+    config.replace_config(copy.deepcopy(base_config))
+
+
+@pytest.fixture(scope="module", name="loop")
+def fixture_loop():
+    """Provide one shared event loop for sync tests driving async summarizer code.
+
+    Calling create_response spins up and tears down a fresh loop via
+    asyncio.run on every call; reusing one loop avoids that fixed cost.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(name="summarizer")
+def fixture_summarizer():
+    """Build a summarizer with a no-op LLM loader.
+
+    Function-scoped on purpose: the instance carries per-request token
+    budget state (TokenBudgetTracker), so it cannot be shared across
+    tests. Tests that exercise constructor behavior (system prompt, tool
+    calling enablement, query mode) still build their own instance.
+    """
+    return DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
 
 
 def test_is_query_helper_subclass():
@@ -70,7 +109,7 @@ def test_is_query_helper_subclass():
 
 def test_if_system_prompt_was_updated():
     """Test if system prompt was overridden from the configuration."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+    summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
     assert summarizer._system_prompt == config.ols_config.system_prompt
 
 
@@ -86,86 +125,82 @@ def test_tool_calling_enabled_when_solr_docs_tool_active_without_mcp():
             PropertyMock(return_value=mock_client),
         ),
     ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+        summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
     assert summarizer._tool_calling_enabled is True
 
 
 def test_tool_calling_disabled_without_mcp_and_without_solr_docs_tool():
     """Tool calling stays off when neither MCP nor Solr docs tool is active."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+    summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
     assert summarizer._tool_calling_enabled is False
 
 
-def test_summarize_empty_history():
-    """Basic test for DocsSummarizer using mocked retriever and empty history."""
-    with (
-        patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4),
-        patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 1),
-    ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        question = "What's the ultimate question with answer 42?"
-        summary = summarizer.create_response(question, MockRetriever(), [])
-        check_summary_result(summary, question)
-
-
-def test_summarize_no_history():
-    """Basic test for DocsSummarizer without explicit history argument."""
+@pytest.mark.parametrize(
+    ("min_ctx", "history"),
+    [
+        pytest.param(1, [], id="empty_history"),
+        pytest.param(3, None, id="no_history"),
+        pytest.param(
+            3,
+            [CacheEntry(query=HumanMessage("What is Kubernetes?"))],
+            id="history_provided",
+        ),
+    ],
+)
+def test_summarize_history_variants(min_ctx, history, summarizer, loop):
+    """Basic test for DocsSummarizer across empty, default and provided history."""
+    question = "What's the ultimate question with answer 42?"
     with (
-        patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4),
-        patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3),
+        patch.object(token_handler, "RAG_SIMILARITY_CUTOFF", 0.4),
+        patch.object(token_handler, "MINIMUM_CONTEXT_TOKEN_LIMIT", min_ctx),
+        patch("ols.config.conversation_cache.get", return_value=history),
     ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        question = "What's the ultimate question with answer 42?"
-        summary = summarizer.create_response(question, MockRetriever())
-        check_summary_result(summary, question)
+        if history is None:
+            summary = loop.run_until_complete(
+                summarizer._create_response_async(question, _MOCK_RETRIEVER)
+            )
+        else:
+            summary = loop.run_until_complete(
+                summarizer._create_response_async(
+                    question, _MOCK_RETRIEVER, "user-id", "conv-id"
+                )
+            )
+        expected = history[0].query.content if history else question
+        check_summary_result(summary, expected)
 
 
-def test_summarize_history_provided():
-    """Basic test with explicit history vs default history paths."""
+def test_summarize_history_provided_skips_limit_pass(summarizer, loop):
+    """Non-overflow history path returns early without a second limit pass."""
     with (
-        patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4),
-        patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3),
-        patch("ols.config.conversation_cache.get") as mock_cache_get,
+        patch.object(token_handler, "RAG_SIMILARITY_CUTOFF", 0.4),
+        patch.object(token_handler, "MINIMUM_CONTEXT_TOKEN_LIMIT", 3),
+        patch(
+            "ols.config.conversation_cache.get",
+            return_value=[CacheEntry(query=HumanMessage("What is Kubernetes?"))],
+        ),
+        patch.object(
+            TokenHandler, "limit_conversation_history", return_value=([], False)
+        ) as mock_limit_history,
     ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        question = "What's the ultimate question with answer 42?"
-        rag_retriever = MockRetriever()
-
-        mock_cache_get.return_value = [
-            CacheEntry(query=HumanMessage("What is Kubernetes?"))
-        ]
-        with patch(
-            "ols.src.query_helpers.docs_summarizer.TokenHandler.limit_conversation_history",
-            return_value=([], False),
-        ) as token_handler:
-            summary1 = summarizer.create_response(
-                question, rag_retriever, "user-id", "conv-id"
-            )
-            # Non-overflow path returns early from prepare_history (no second limit pass).
-            token_handler.assert_not_called()
-            check_summary_result(summary1, "What is Kubernetes?")
-
-        mock_cache_get.return_value = []
-        with patch(
-            "ols.src.query_helpers.docs_summarizer.TokenHandler.limit_conversation_history",
-            return_value=([], False),
-        ) as token_handler:
-            summary2 = summarizer.create_response(
-                question, rag_retriever, "user-id", "conv-id2"
+        loop.run_until_complete(
+            summarizer._create_response_async(
+                "What's the ultimate question with answer 42?",
+                _MOCK_RETRIEVER,
+                "user-id",
+                "conv-id",
             )
-            token_handler.assert_not_called()
-            check_summary_result(summary2, question)
+        )
+        mock_limit_history.assert_not_called()
 
 
-def test_summarize_truncation():
+def test_summarize_truncation(summarizer):
     """Basic test for DocsSummarizer to check compression avoids truncation."""
     with (
-        patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4),
+        patch.object(token_handler, "RAG_SIMILARITY_CUTOFF", 0.4),
         patch("ols.config.conversation_cache.get") as mock_cache_get,
     ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
         question = "What's the ultimate question with answer 42?"
-        rag_retriever = MockRetriever()
+        rag_retriever = _MOCK_RETRIEVER
 
         history = [
             CacheEntry(
@@ -184,34 +219,42 @@ def test_summarize_truncation():
         assert not summary.history_truncated
 
 
-def test_summarize_no_reference_content():
+def test_summarize_no_reference_content(loop):
     """Basic test when no retriever is provided."""
     summarizer = DocsSummarizer(
         llm_loader=mock_llm_loader(mock_langchain_interface("test response")())
     )
     question = "What's the ultimate question with answer 42?"
-    summary = summarizer.create_response(question)
+    summary = loop.run_until_complete(summarizer._create_response_async(question))
     assert question in summary.response
     assert summary.rag_chunks == []
     assert not summary.history_truncated
 
 
-def test_summarize_retrieval_logging(caplog):
-    """Basic test to ensure retrieval details are visible in logs."""
-    logging_config = LoggingConfig(app_log_level="debug")
-    configure_logging(logging_config)
-    logger = logging.getLogger("ols")
-    logger.handlers = [caplog.handler]
+@pytest.fixture(scope="session", name="debug_logger")
+def fixture_debug_logger():
+    """Configure debug-level application logging only once per session."""
+    configure_logging(LoggingConfig(app_log_level="debug"))
+    return logging.getLogger("ols")
 
-    with (
-        patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4),
-        patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3),
-    ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        question = "What's the ultimate question with answer 42?"
-        summary = summarizer.create_response(question, MockRetriever())
-        check_summary_result(summary, question)
-        assert "Retrieved 1 document nodes for RAG context" in caplog.text
+
+def test_summarize_retrieval_logging(summarizer, debug_logger, caplog, loop):
+    """Basic test to ensure retrieval details are visible in logs."""
+    old_handlers = debug_logger.handlers
+    debug_logger.handlers = [caplog.handler]
+    try:
+        with (
+            patch.object(token_handler, "RAG_SIMILARITY_CUTOFF", 0.4),
+            patch.object(token_handler, "MINIMUM_CONTEXT_TOKEN_LIMIT", 3),
+        ):
+            question = "What's the ultimate question with answer 42?"
+            summary = loop.run_until_complete(
+                summarizer._create_response_async(question, _MOCK_RETRIEVER)
+            )
+            check_summary_result(summary, question)
+            assert "Retrieved 1 document nodes for RAG context" in caplog.text
+    finally:
+        debug_logger.handlers = old_handlers
 
 
 @pytest.mark.asyncio
@@ -226,7 +269,7 @@ async def test_resolve_tools_appends_openshift_docs_tool_when_solr_configured_no
         config.ols_config.solr_hybrid = SolrHybridSettings()
         config.__dict__["solr_hybrid_search"] = MagicMock()
         try:
-            summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+            summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
             tools = await summarizer._resolve_tools_for_request("query")
         finally:
             config.ols_config.solr_hybrid = prev
@@ -296,27 +339,74 @@ async def async_mock_invoke(yield_values):
         yield value
 
 
-def test_tool_calling_one_iteration():
-    """Test tool calling - stops after one iteration."""
-    with patch(
-        "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm"
-    ) as mock_invoke:
-        mock_invoke.side_effect = lambda *args, **kwargs: async_mock_invoke(
-            [AIMessageChunk(content="XYZ", response_metadata={"finish_reason": "stop"})]
+class _StubMCPClient:
+    """Minimal MCP client stand-in returning the static tools map."""
+
+    async def get_tools(self, **kwargs):
+        return mock_tools_map
+
+
+# static chunks reused across tests; each _invoke_llm call still gets
+# a fresh async generator, but the chunk payloads are built only once
+_STOP_CHUNK = AIMessageChunk(content="XYZ", response_metadata={"finish_reason": "stop"})
+_TOOL_CALLS_CHUNK = AIMessageChunk(
+    content="",
+    response_metadata={"finish_reason": "tool_calls"},
+    tool_call_chunks=[
+        {
+            "name": "get_namespaces_mock",
+            "args": "{}",
+            "id": "call_1",
+            "index": 0,
+        }
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    ("max_iter", "chunks", "expected_calls"),
+    [
+        pytest.param(None, (_STOP_CHUNK,), 1, id="stop_after_one_iteration"),
+        pytest.param(None, None, 2, id="tool_call_then_stop"),
+        pytest.param(3, (_TOOL_CALLS_CHUNK,), 3, id="force_stop_by_max_rounds"),
+    ],
+)
+def test_tool_calling_iterations(max_iter, chunks, expected_calls, summarizer, loop):
+    """Test how many tool loop rounds run for stop, tool-call and forced-stop flows."""
+    with contextlib.ExitStack() as stack:
+        mock_invoke = stack.enter_context(
+            patch.object(LLMExecutionAgent, "_invoke_llm")
         )
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+        stack.enter_context(
+            patch(
+                "ols.src.query_helpers.docs_summarizer.get_mcp_tools",
+                new=AsyncMock(return_value=mock_tools_map),
+            )
+        )
+        if max_iter is not None:
+            stack.enter_context(
+                patch.object(
+                    DocsSummarizer, "_get_max_iterations", return_value=max_iter
+                )
+            )
+        if chunks is None:
+            mock_invoke.side_effect = make_fake_invoke_llm()
+        else:
+            mock_invoke.side_effect = lambda *args, **kwargs: async_mock_invoke(chunks)
         summarizer._tool_calling_enabled = True
-        summarizer.create_response("How many namespaces are there in my cluster?")
-        assert mock_invoke.call_count == 1
+        loop.run_until_complete(
+            summarizer._create_response_async(
+                "How many namespaces are there in my cluster?"
+            )
+        )
+        assert mock_invoke.call_count == expected_calls
 
 
-def test_tool_calling_drains_chunks_after_stop():
+def test_tool_calling_drains_chunks_after_stop(summarizer, loop):
     """Test that chunks after finish_reason=stop are consumed but not forwarded."""
     question = "How many namespaces are there in my cluster?"
 
-    with patch(
-        "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm"
-    ) as mock_invoke:
+    with patch.object(LLMExecutionAgent, "_invoke_llm") as mock_invoke:
         mock_invoke.side_effect = lambda *args, **kwargs: async_mock_invoke(
             [
                 AIMessageChunk(content="Hello", response_metadata={}),
@@ -325,93 +415,33 @@ def test_tool_calling_drains_chunks_after_stop():
                 AIMessageChunk(content="trailing2", response_metadata={}),
             ]
         )
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
         summarizer._tool_calling_enabled = True
-        summary = summarizer.create_response(question)
+        summary = loop.run_until_complete(summarizer._create_response_async(question))
         assert mock_invoke.call_count == 1
         assert "Hello" in summary.response
         assert "trailing" not in summary.response
 
 
-async def fake_invoke_llm(*args, **kwargs):
-    """Fake invoke_llm function to simulate two-turn LLM behavior."""
-    if not hasattr(fake_invoke_llm, "call_count"):
-        fake_invoke_llm.call_count = 0
-    fake_invoke_llm.call_count += 1
-
-    if fake_invoke_llm.call_count == 1:
-        yield AIMessageChunk(
-            content="",
-            response_metadata={"finish_reason": "tool_calls"},
-            tool_call_chunks=[
-                {
-                    "name": "get_namespaces_mock",
-                    "args": "{}",
-                    "id": "call_1",
-                    "index": 0,
-                }
-            ],
-        )
-    elif fake_invoke_llm.call_count == 2:
-        yield AIMessageChunk(content="XYZ", response_metadata={"finish_reason": "stop"})
+def make_fake_invoke_llm():
+    """Create a fake invoke_llm function simulating two-turn LLM behavior.
 
+    Call count is kept in a per-instance closure instead of a function
+    attribute, so reruns of the same test start from a clean state.
+    """
+    calls = [0]
 
-def test_tool_calling_two_iteration():
-    """Test tool calling - stops after two iterations."""
-    with (
-        patch(
-            "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm",
-            new=fake_invoke_llm,
-        ) as mock_invoke,
-        patch(
-            "ols.src.query_helpers.docs_summarizer.get_mcp_tools",
-            new=AsyncMock(return_value=mock_tools_map),
-        ),
-    ):
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        summarizer._tool_calling_enabled = True
-        summarizer.create_response("How many namespaces are there in my cluster?")
-        assert mock_invoke.call_count == 2
+    async def fake_invoke_llm(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] == 1:
+            yield _TOOL_CALLS_CHUNK
+        elif calls[0] == 2:
+            yield _STOP_CHUNK
 
-
-def test_tool_calling_force_stop():
-    """Test tool calling - force stop by max rounds."""
-    with (
-        patch(
-            "ols.src.query_helpers.docs_summarizer.DocsSummarizer._get_max_iterations",
-            return_value=3,
-        ),
-        patch(
-            "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm"
-        ) as mock_invoke,
-        patch(
-            "ols.src.query_helpers.docs_summarizer.get_mcp_tools",
-            new=AsyncMock(return_value=mock_tools_map),
-        ),
-    ):
-        mock_invoke.side_effect = lambda *args, **kwargs: async_mock_invoke(
-            [
-                AIMessageChunk(
-                    content="",
-                    response_metadata={"finish_reason": "tool_calls"},
-                    tool_call_chunks=[
-                        {
-                            "name": "get_namespaces_mock",
-                            "args": "{}",
-                            "id": "call_1",
-                            "index": 0,
-                        }
-                    ],
-                )
-            ]
-        )
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
-        summarizer._tool_calling_enabled = True
-        summarizer.create_response("How many namespaces are there in my cluster?")
-        assert mock_invoke.call_count == 3
+    fake_invoke_llm.calls = calls
+    return fake_invoke_llm
 
 
-def test_tool_calling_tool_execution(caplog):
+def test_tool_calling_tool_execution(summarizer, caplog, loop):
     """Test tool execution path with one valid and one invalid tool call."""
     caplog.set_level(10)
     mcp_servers_config = {
@@ -422,19 +452,18 @@ def test_tool_calling_tool_execution(caplog):
     }
 
     with (
+        patch.object(DocsSummarizer, "_get_max_iterations", return_value=2),
         patch(
-            "ols.src.query_helpers.docs_summarizer.DocsSummarizer._get_max_iterations",
-            return_value=2,
+            "ols.utils.mcp_utils.MultiServerMCPClient",
+            return_value=_StubMCPClient(),
         ),
-        patch("ols.utils.mcp_utils.MultiServerMCPClient") as mock_mcp_client_cls,
-        patch(
-            "ols.src.query_helpers.docs_summarizer.TokenBudgetTracker.tools_round_budget",
+        patch.object(
+            TokenBudgetTracker,
+            "tools_round_budget",
             new_callable=PropertyMock,
             return_value=1000,
         ),
-        patch(
-            "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm"
-        ) as mock_invoke,
+        patch.object(LLMExecutionAgent, "_invoke_llm") as mock_invoke,
         patch(
             "ols.src.query_helpers.docs_summarizer.build_mcp_config",
             return_value=mcp_servers_config,
@@ -457,13 +486,12 @@ def test_tool_calling_tool_execution(caplog):
             ]
         )
 
-        mock_mcp_client_instance = AsyncMock()
-        mock_mcp_client_instance.get_tools.return_value = mock_tools_map
-        mock_mcp_client_cls.return_value = mock_mcp_client_instance
-
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
         summarizer.model_config.max_tokens_for_tools = 100
-        summarizer.create_response("How many namespaces are there in my cluster?")
+        loop.run_until_complete(
+            summarizer._create_response_async(
+                "How many namespaces are there in my cluster?"
+            )
+        )
 
         assert "get_namespaces_mock" in caplog.text
         assert "invalid_function_name" in caplog.text
@@ -472,7 +500,7 @@ def test_tool_calling_tool_execution(caplog):
 
 def test_build_final_prompt_raises_when_tool_definitions_exceed_prompt_budget() -> None:
     """Tool definitions token estimate is validated with the final prompt budget."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
+    summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE)
     summarizer._tracker = TokenBudgetTracker(
         token_handler=TokenHandler(),
         context_window_size=1000,
@@ -492,7 +520,7 @@ def test_build_final_prompt_raises_when_tool_definitions_exceed_prompt_budget()
         )
 
 
-def test_tool_output_token_tracking_uses_buffer_weight(caplog):
+def test_tool_output_token_tracking_uses_buffer_weight(summarizer, caplog, loop):
     """Test that tool output tokens are counted with TOKEN_BUFFER_WEIGHT like other budget items.
 
     Before this fix, raw len(tokens) was used for tool outputs while tool definitions
@@ -517,14 +545,12 @@ def test_tool_output_token_tracking_uses_buffer_weight(caplog):
         return original_get_token_count(tokens)
 
     with (
+        patch.object(DocsSummarizer, "_get_max_iterations", return_value=2),
         patch(
-            "ols.src.query_helpers.docs_summarizer.DocsSummarizer._get_max_iterations",
-            return_value=2,
+            "ols.utils.mcp_utils.MultiServerMCPClient",
+            return_value=_StubMCPClient(),
         ),
-        patch("ols.utils.mcp_utils.MultiServerMCPClient") as mock_mcp_client_cls,
-        patch(
-            "ols.src.query_helpers.llm_execution_agent.LLMExecutionAgent._invoke_llm"
-        ) as mock_invoke,
+        patch.object(LLMExecutionAgent, "_invoke_llm") as mock_invoke,
         patch("ols.utils.mcp_utils.config") as mock_config,
         patch.object(
             TokenHandler, "_get_token_count", staticmethod(counting_get_token_count)
@@ -553,13 +579,10 @@ def test_tool_output_token_tracking_uses_buffer_weight(caplog):
                 ]
             )
 
-        mock_mcp_client_instance = AsyncMock()
-        mock_mcp_client_instance.get_tools.return_value = mock_tools_map
-        mock_mcp_client_cls.return_value = mock_mcp_client_instance
-
-        summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
         summarizer.model_config.max_tokens_for_tools = 50000
-        summarizer.create_response("How many namespaces?")
+        loop.run_until_complete(
+            summarizer._create_response_async("How many namespaces?")
+        )
 
     # _get_token_count must be called for:
     #   1. tool definitions (once at the start of the loop)
@@ -619,7 +642,7 @@ def test_build_mcp_config_transport_is_streamable_http():
 def test_get_max_iterations_ask_mode_no_override():
     """Test _get_max_iterations returns ASK default when config has no override."""
     config.ols_config.max_iterations = None
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None), mode=QueryMode.ASK)
+    summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE, mode=QueryMode.ASK)
     assert summarizer._get_max_iterations() == DEFAULT_MAX_ITERATIONS
 
 
@@ -627,7 +650,7 @@ def test_get_max_iterations_troubleshooting_mode_no_override():
     """Test _get_max_iterations returns TROUBLESHOOTING default when config has no override."""
     config.ols_config.max_iterations = None
     summarizer = DocsSummarizer(
-        llm_loader=mock_llm_loader(None), mode=QueryMode.TROUBLESHOOTING
+        llm_loader=_MOCK_LOADER_NONE, mode=QueryMode.TROUBLESHOOTING
     )
     assert summarizer._get_max_iterations() == DEFAULT_MAX_ITERATIONS_TROUBLESHOOTING
 
@@ -637,7 +660,7 @@ def test_get_max_iterations_config_override_above_default():
     config.ols_config.max_iterations = 20
     try:
         for mode in (QueryMode.ASK, QueryMode.TROUBLESHOOTING):
-            summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None), mode=mode)
+            summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE, mode=mode)
             assert summarizer._get_max_iterations() == 20
     finally:
         config.ols_config.max_iterations = None
@@ -647,13 +670,11 @@ def test_get_max_iterations_config_override_below_default():
     """Test _get_max_iterations uses mode default when it exceeds the config value."""
     config.ols_config.max_iterations = 10
     try:
-        summarizer = DocsSummarizer(
-            llm_loader=mock_llm_loader(None), mode=QueryMode.ASK
-        )
+        summarizer = DocsSummarizer(llm_loader=_MOCK_LOADER_NONE, mode=QueryMode.ASK)
         assert summarizer._get_max_iterations() == 10
 
         summarizer = DocsSummarizer(
-            llm_loader=mock_llm_loader(None), mode=QueryMode.TROUBLESHOOTING
+            llm_loader=_MOCK_LOADER_NONE, mode=QueryMode.TROUBLESHOOTING
         )
         assert (
             summarizer._get_max_iterations() == DEFAULT_MAX_ITERATIONS_TROUBLESHOOTING
@@ -662,9 +683,8 @@ def test_get_max_iterations_config_override_below_default():
         config.ols_config.max_iterations = None
 
 
-def test_create_response_raises_on_unknown_chunk_type():
+def test_create_response_raises_on_unknown_chunk_type(summarizer):
     """Test create_response raises ValueError on unsupported chunk type."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
 
     class UnknownChunk:
         type = "unsupported"
@@ -679,9 +699,8 @@ def test_create_response_raises_on_unknown_chunk_type():
             summarizer.create_response("q")
 
 
-def test_create_response_ignores_reasoning_chunks():
+def test_create_response_ignores_reasoning_chunks(summarizer):
     """Test create_response skips reasoning chunks without error."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     from ols.app.models.models import StreamedChunk
 
     async def _fake_generate(self, *args, **kwargs):
@@ -1,5 +1,6 @@
 """Unit tests for history support helpers."""
 
+import copy
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -18,9 +19,9 @@ from ols.utils.token_handler import TokenHandler
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
-    """Set up config for tests."""
-    config.reload_from_yaml_file("tests/config/valid_config_without_mcp.yaml")
+def _setup(base_config):
+    """Set up config for tests from the shared package snapshot."""
+    config.replace_config(copy.deepcopy(base_config))
 
 
 @pytest.mark.asyncio
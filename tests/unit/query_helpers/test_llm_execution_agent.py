@@ -1,6 +1,7 @@
 """Unit tests for LLMExecutionAgent."""
 
 import asyncio
+import copy
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -52,9 +53,9 @@ class SampleTool(StructuredTool):
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
-    """Set up config for tests."""
-    config.reload_from_yaml_file("tests/config/valid_config_without_mcp.yaml")
+def _setup(base_config):
+    """Set up config for tests from the shared package snapshot."""
+    config.replace_config(copy.deepcopy(base_config))
 
 
 def _make_agent(**overrides: object) -> LLMExecutionAgent:
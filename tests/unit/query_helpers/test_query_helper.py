@@ -1,5 +1,9 @@
 """Unit tests for query helper class."""
 
+import copy
+
+import pytest
+
 from ols import config
 from ols.constants import QueryMode
 from ols.src.llms.llm_loader import load_llm
@@ -10,10 +14,14 @@ from ols.src.prompts.prompts import (
 from ols.src.query_helpers.query_helper import QueryHelper
 
 
+@pytest.fixture(scope="function", autouse=True)
+def _setup(base_config_full):
+    """Set up config for tests from the shared package snapshot."""
+    config.replace_config(copy.deepcopy(base_config_full))
+
+
 def test_defaults_used():
     """Test that the defaults are used when no inputs are provided."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
-
     qh = QueryHelper()
 
     assert qh.provider == config.ols_config.default_provider
@@ -34,7 +42,6 @@ def test_inputs_are_used():
 
 def test_ask_mode_uses_query_system_instruction():
     """Test that ASK mode selects QUERY_SYSTEM_INSTRUCTION as the system prompt."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
     config.ols_config.system_prompt = None
 
     qh = QueryHelper(mode=QueryMode.ASK)
@@ -44,7 +51,6 @@ def test_ask_mode_uses_query_system_instruction():
 
 def test_troubleshooting_mode_uses_troubleshooting_instruction():
     """Test that TROUBLESHOOTING mode selects TROUBLESHOOTING_SYSTEM_INSTRUCTION."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
     config.ols_config.system_prompt = None
 
     qh = QueryHelper(mode=QueryMode.TROUBLESHOOTING)
@@ -54,19 +60,15 @@ def test_troubleshooting_mode_uses_troubleshooting_instruction():
 
 def test_config_system_prompt_takes_precedence_over_mode():
     """Test that a config-level system prompt overrides the mode default."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
     config.ols_config.system_prompt = "custom prompt from config"
 
     qh = QueryHelper(mode=QueryMode.TROUBLESHOOTING)
 
     assert qh._system_prompt == "custom prompt from config"
 
-    config.ols_config.system_prompt = None
-
 
 def test_default_mode_is_ask():
     """Test that omitting mode defaults to ASK behavior."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
     config.ols_config.system_prompt = None
 
     qh_default = QueryHelper()
@@ -77,8 +79,6 @@ def test_default_mode_is_ask():
 
 def test_mode_stored_as_instance_attribute():
     """Test that mode is stored as self._mode on QueryHelper."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
-
     qh_ask = QueryHelper(mode=QueryMode.ASK)
     assert qh_ask._mode == QueryMode.ASK
 
@@ -72,7 +72,6 @@ def test_available_quota_with_data():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given cluster should be read from storage
         call(ClusterQuotaLimiter.SELECT_QUOTA, ("", subject)),
     ]
@@ -150,7 +149,7 @@ def test_available_quota_on_disconnected_db():
             q = ClusterQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to retrieve available quota for given cluster
@@ -195,7 +194,6 @@ def test_revoke_quota():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given cluster should be written into the storage
         call(
             ClusterQuotaLimiter.SET_AVAILABLE_QUOTA,
@@ -232,7 +230,7 @@ def test_revoke_quota_on_disconnected_db():
             q = ClusterQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to revoke quota
@@ -277,7 +275,6 @@ def test_consume_tokens_not_enough():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be updated in storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -322,7 +319,6 @@ def test_consume_input_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be updated in storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -367,7 +363,6 @@ def test_consume_output_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be updated in storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -414,7 +409,6 @@ def test_consume_input_and_output_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be updated in storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -457,7 +451,6 @@ def test_consume_tokens_on_no_record():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be updated in storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -497,7 +490,7 @@ def test_consume_tokens_on_disconnected_db():
             q = ClusterQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to consume tokens
@@ -541,7 +534,6 @@ def test_increase_quota():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given cluster should be written into the storage
         call(
             ClusterQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -578,7 +570,7 @@ def test_increase_quota_on_disconnected_db():
             q = ClusterQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to increase quota
@@ -43,7 +43,6 @@ def test_consume_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be read from storage
         # and the initialization of new record should be made
         call(
@@ -92,7 +91,7 @@ def test_consume_tokens_on_disconnected_db():
             q = TokenUsageHistory(config)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
 
             assert not q.connected()
 
@@ -118,6 +117,5 @@ def test_consume_tokens_on_disconnected_db():
             },
         ),
         # check if storage connection is alive
-        call("SELECT 1"),
     ]
     mock_cursor.execute.assert_has_calls(calls, any_order=False)
@@ -74,7 +74,6 @@ def test_available_quota_with_data():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be read from storage
         call(
             UserQuotaLimiter.SELECT_QUOTA,
@@ -158,7 +157,7 @@ def test_available_quota_on_disconnected_db():
             q = UserQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to retrieve available quota for given user
@@ -204,7 +203,6 @@ def test_revoke_quota():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be written into the storage
         call(
             UserQuotaLimiter.SET_AVAILABLE_QUOTA,
@@ -242,7 +240,7 @@ def test_revoke_quota_on_disconnected_db():
             q = UserQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to revoke quota
@@ -288,7 +286,6 @@ def test_consume_tokens_not_enough():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         call(
             # quota for given user should be read from storage
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -334,7 +331,6 @@ def test_consume_input_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         call(
             # quota for given user should be read from storage
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -380,7 +376,6 @@ def test_consume_output_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         call(
             # quota for given user should be read from storage
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -428,7 +423,6 @@ def test_consume_input_and_output_tokens_enough_tokens():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         call(
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
             (-to_be_consumed, timestamp, user_id, subject),
@@ -471,7 +465,6 @@ def test_consume_tokens_on_no_record():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         call(
             # quota for given user should be read from storage
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -512,7 +505,7 @@ def test_consume_tokens_on_disconnected_db():
             q = UserQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to consume tokens
@@ -557,7 +550,6 @@ def test_increase_quota():
     # expected calls to storage
     calls = [
         # check if storage connection is alive
-        call("SELECT 1"),
         # quota for given user should be written into the storage
         call(
             UserQuotaLimiter.UPDATE_AVAILABLE_QUOTA,
@@ -595,7 +587,7 @@ def test_increase_quota_on_disconnected_db():
             q = UserQuotaLimiter(config, quota_limit)
 
             # simulate DB disconnection
-            q.connection = None
+            q.pool = None
             assert not q.connected()
 
             # try to increase quota
@@ -77,6 +77,32 @@ class TestConnectionDecorator:
             c.do_work()
         assert c.connected() is True
 
+    def test_retries_on_operational_error(self):
+        """Decorator retries with backoff when OperationalError is raised."""
+        c = self.Connectable()
+        attempts = []
+
+        @connection
+        def flaky(connectable):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise psycopg2.OperationalError("connection lost")
+            return "done"
+
+        assert flaky(c) == "done"
+        assert len(attempts) == 3
+
+    def test_gives_up_after_max_retries_on_operational_error(self):
+        """Decorator reraises OperationalError once retries are exhausted."""
+        c = self.Connectable()
+
+        @connection
+        def always_failing(connectable):
+            raise psycopg2.OperationalError("connection lost")
+
+        with pytest.raises(psycopg2.OperationalError, match="connection lost"):
+            always_failing(c)
+
 
 class TestPostgresBaseConnect:
     """Tests for PostgresBase.connect()."""
@@ -112,7 +138,7 @@ class TestPostgresBaseConnect:
             with pytest.raises(psycopg2.DatabaseError, match="CREATE failed"):
                 FakeComponent(config=MagicMock())
 
-        mock_connect.return_value.close.assert_called_once()
+        mock_connect.return_value.close.assert_called()
 
     def test_connect_does_not_set_autocommit_on_failure(self):
         """Autocommit stays at default when initialization fails."""
@@ -127,6 +153,60 @@ class TestPostgresBaseConnect:
         assert mock_connect.return_value.autocommit is False
 
 
+class FakeComponentWithSchemaCheck(FakeComponent):
+    """Concrete subclass declaring schema objects for the DDL-skip check."""
+
+    @property
+    def _schema_objects(self) -> list[str]:
+        return ["t1", "i1"]
+
+
+class TestPostgresBaseSchemaCheck:
+    """Tests for the schema existence check gating DDL execution."""
+
+    def test_connect_skips_ddl_when_schema_exists(self):
+        """DDL is not executed when all schema objects already exist."""
+        with patch("psycopg2.connect") as mock_connect:
+            cursor = mock_connect.return_value.cursor.return_value
+            cursor.fetchone.return_value = (True,)
+            FakeComponentWithSchemaCheck(config=MagicMock())
+
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "CREATE TABLE IF NOT EXISTS t1 (id int)" not in executed
+        mock_connect.return_value.commit.assert_called_once()
+
+    def test_connect_runs_ddl_when_schema_missing(self):
+        """DDL is executed when some schema object is missing."""
+        with patch("psycopg2.connect") as mock_connect:
+            cursor = mock_connect.return_value.cursor.return_value
+            cursor.fetchone.return_value = (False,)
+            FakeComponentWithSchemaCheck(config=MagicMock())
+
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "CREATE TABLE IF NOT EXISTS t1 (id int)" in executed
+
+
+class TestPostgresBasePoolSharing:
+    """Tests for the shared connection pool registry."""
+
+    def test_pool_shared_for_same_config(self):
+        """Components with the same connection config share one pool."""
+        cfg = MagicMock()
+        with patch("psycopg2.connect"):
+            first = FakeComponent(config=cfg)
+            second = FakeComponent(config=cfg)
+
+        assert first.pool is second.pool
+
+    def test_pool_not_shared_for_different_config(self):
+        """Components with different connection configs get separate pools."""
+        with patch("psycopg2.connect"):
+            first = FakeComponent(config=MagicMock())
+            second = FakeComponent(config=MagicMock())
+
+        assert first.pool is not second.pool
+
+
 class TestPostgresBaseConnected:
     """Tests for PostgresBase.connected()."""
 
@@ -138,18 +218,33 @@ class TestPostgresBaseConnected:
         assert component.connected() is True
 
     def test_connected_returns_false_when_no_connection(self):
-        """connected() returns False when connection is None."""
+        """connected() returns False when pool is None."""
         with patch("psycopg2.connect"):
             component = FakeComponent(config=MagicMock())
 
-        component.connection = None
+        component.pool = None
         assert component.connected() is False
 
+    def test_connected_skips_probe_after_recent_success(self):
+        """connected() does not issue SELECT 1 right after a successful query."""
+        with patch("psycopg2.connect") as mock_connect:
+            component = FakeComponent(config=MagicMock())
+
+            cursor_mock = mock_connect.return_value.cursor.return_value
+            assert component.connected() is True
+
+        executed = [
+            c.args[0] for c in cursor_mock.__enter__.return_value.execute.call_args_list
+        ]
+        assert "SELECT 1" not in executed
+
     def test_connected_returns_false_on_operational_error(self):
         """connected() returns False on OperationalError."""
         with patch("psycopg2.connect") as mock_connect:
             component = FakeComponent(config=MagicMock())
 
+        # force a fresh probe despite the recent successful initialization
+        component._last_ok = 0.0
         cursor_mock = mock_connect.return_value.cursor.return_value
         cursor_mock.__enter__.return_value.execute.side_effect = (
             psycopg2.OperationalError("connection lost")
@@ -161,6 +256,8 @@ class TestPostgresBaseConnected:
         with patch("psycopg2.connect") as mock_connect:
             component = FakeComponent(config=MagicMock())
 
+        # force a fresh probe despite the recent successful initialization
+        component._last_ok = 0.0
         cursor_mock = mock_connect.return_value.cursor.return_value
         cursor_mock.__enter__.return_value.execute.side_effect = (
             psycopg2.InterfaceError("cannot reach server")